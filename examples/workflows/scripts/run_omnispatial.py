@@ -113,7 +113,7 @@ def build_parser() -> argparse.ArgumentParser:
     convert.add_argument("--image-chunks", help="Image chunking, e.g. 1,256,256")
     convert.add_argument("--label-chunks", help="Label chunking, e.g. 256,256")
     convert.add_argument("--compressor", default="zstd", help="Compression codec to use for NGFF outputs.")
-    convert.add_argument("--compression-level", type=int, default=5, help="Compression level for NGFF outputs.")
+    convert.add_argument("--compression-level", type=int, default=1, help="Compression level for NGFF outputs.")
     convert.add_argument("--validate-output", action="store_true", help="Run validation after conversion.")
     convert.add_argument("--validation-format", choices=["ngff", "spatialdata"], help="Override validation format if needed.")
     convert.add_argument("--report-path", help="Write validation report JSON to this path.")
@@ -8,8 +8,7 @@ from typing import Any, Dict, Iterable, List, Optional, Tuple
 import anndata as ad
 import numpy as np
 import pandas as pd
-from shapely import wkt
-from shapely.affinity import translate
+import shapely
 
 from omnispatial.adapters.base import SpatialAdapter
 from omnispatial.adapters.registry import register_adapter
@@ -21,7 +20,7 @@ from omnispatial.core.model import (
     SpatialDataset,
     TableLayer,
 )
-from omnispatial.utils import dataframe_summary, read_image_any, load_tabular_file, temporary_output_path
+from omnispatial.utils import dataframe_summary, load_tabular_file, probe_image_shape, temporary_output_path
 
 CELLS_FILE = "cells.parquet"
 EXPR_FILE = "expr.parquet"
@@ -63,8 +62,7 @@ class CosMxAdapter(SpatialAdapter):
         cells = self._load_cells(base / CELLS_FILE)
         expr = self._load_expr(base / EXPR_FILE)
         image_path = base / IMAGE_PATH
-        image_data, _ = read_image_any(image_path)
-        region_offsets = self._compute_region_offsets(cells, image_data.shape[-1])
+        region_offsets = self._compute_region_offsets(cells, probe_image_shape(image_path)[-1])
         stitched_cells = self._apply_offsets(cells, region_offsets)
 
         local_frame = CoordinateFrame(
@@ -158,12 +156,13 @@ class CosMxAdapter(SpatialAdapter):
         adjusted = cells.copy()
         adjusted["x"] = cells["centroid_x"] + cells["region"].map(offsets)
         adjusted["y"] = cells["centroid_y"]
-        polygons = []
-        for region, wkt_string in zip(cells["region"], cells["polygon_wkt"]):
-            polygon = wkt.loads(wkt_string)
-            polygon = translate(polygon, xoff=offsets[region], yoff=0.0)
-            polygons.append(polygon.wkt)
-        adjusted["polygon_wkt"] = polygons
+        geometries = shapely.from_wkt(cells["polygon_wkt"].to_numpy(dtype=object))
+        xoff = cells["region"].map(offsets).to_numpy(dtype=float)
+        # Region offsets are pure x shifts, so add them to every vertex in one array operation.
+        coords, owners = shapely.get_coordinates(geometries, return_index=True)
+        coords[:, 0] += xoff[owners]
+        geometries = shapely.set_coordinates(geometries, coords)
+        adjusted["polygon_wkt"] = shapely.to_wkt(geometries, rounding_precision=-1).tolist()
         return adjusted
 
     def _build_label_layer(
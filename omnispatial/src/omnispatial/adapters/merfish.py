@@ -66,7 +66,10 @@ class MerfishAdapter(SpatialAdapter):
         else:
             cells, source = self._derive_bins(spots)
 
-        polygons = {row.cell_id: self._ensure_polygon(row.polygon_wkt) for row in cells.itertuples()}
+        polygons = {
+            cell_id: self._ensure_polygon(polygon_wkt)
+            for cell_id, polygon_wkt in zip(cells["cell_id"].tolist(), cells["polygon_wkt"].tolist())
+        }
         counts = self._aggregate_spots(spots, polygons)
 
         local_frame = CoordinateFrame(
@@ -188,17 +191,25 @@ class MerfishAdapter(SpatialAdapter):
 
     def _aggregate_spots(self, spots: pd.DataFrame, polygons: Dict[str, BaseGeometry]) -> pd.DataFrame:
         totals: Dict[str, Dict[str, float]] = {cell_id: {} for cell_id in polygons}
-        for row in spots.itertuples():
-            point = Point(float(row.x), float(row.y))
+        # Plain column lists avoid building a namedtuple per spot.
+        spot_genes = spots["gene"].tolist()
+        rows = zip(
+            spots["x"].to_numpy(dtype=float).tolist(),
+            spots["y"].to_numpy(dtype=float).tolist(),
+            spot_genes,
+            spots["intensity"].to_numpy(dtype=float).tolist(),
+        )
+        for x, y, gene, intensity in rows:
+            point = Point(x, y)
             assigned = False
             for cell_id, polygon in polygons.items():
                 if polygon.covers(point):
-                    totals[cell_id][row.gene] = totals[cell_id].get(row.gene, 0.0) + float(row.intensity)
+                    totals[cell_id][gene] = totals[cell_id].get(gene, 0.0) + intensity
                     assigned = True
                     break
             if not assigned:
                 raise ValueError("Encountered spot outside derived bins.")
-        genes = sorted({row.gene for row in spots.itertuples()})
+        genes = sorted(set(spot_genes))
         order = list(polygons.keys())
         data = []
         for cell_id in order:
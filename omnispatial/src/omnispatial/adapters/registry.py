@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from importlib import metadata
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Type
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from omnispatial.adapters.base import SpatialAdapter
 from omnispatial.core.metadata import SampleMetadata
@@ -23,12 +24,19 @@ def register_adapter(adapter_cls: Type[SpatialAdapter]) -> Type[SpatialAdapter]:
     name = getattr(adapter_cls, "name", adapter_cls.__name__).lower()
     adapter_cls.name = name  # type: ignore[attr-defined]
     _REGISTERED_ADAPTERS[name] = adapter_cls
+    _default_adapter_classes.cache_clear()
     return adapter_cls
 
 
+@lru_cache(maxsize=None)
+def _cached_entry_points():
+    # Enumerating entry points rescans every installed distribution, so do it once per process.
+    return metadata.entry_points()
+
+
 def _select_entry_points(group: str):
     try:
-        entry_points = metadata.entry_points()
+        entry_points = _cached_entry_points()
     except Exception as exc:  # pragma: no cover - importlib edge case
         LOG.debug("Unable to enumerate adapter entry points: %s", exc)
         return []
@@ -46,6 +54,8 @@ def load_adapter_plugins(force: bool = False) -> None:
         return
 
     _ENTRYPOINTS_LOADED = True
+    if force:
+        _cached_entry_points.cache_clear()
     for entry in _select_entry_points(_ENTRYPOINT_GROUP):
         try:
             resolved = entry.load()
@@ -119,12 +129,17 @@ class AdapterRegistry:
 
     @classmethod
     def default(cls) -> "AdapterRegistry":
-        """Create a registry seeded with all registered adapters."""
-        # Ensure built-in adapters are imported so they register themselves.
-        from . import cosmx, merfish, xenium  # noqa: F401
+        """Create a registry seeded with all registered adapters.
+
+        Adapter discovery is cached; each call still returns a new registry so
+        ``register`` on one instance never leaks into another.
+        """
+        return cls(_default_adapter_classes())
 
-        load_adapter_plugins()
-        return cls()
+    @staticmethod
+    def clear_default_cache() -> None:
+        """Drop the cached adapter classes used by :meth:`default`."""
+        _default_adapter_classes.cache_clear()
 
     def register(self, adapter_cls: Type[SpatialAdapter]) -> None:
         """Register a SpatialAdapter subclass."""
@@ -163,6 +178,15 @@ class AdapterRegistry:
                 yield name
 
 
+@lru_cache(maxsize=1)
+def _default_adapter_classes() -> Tuple[Type[SpatialAdapter], ...]:
+    # Ensure built-in adapters are imported so they register themselves.
+    from . import cosmx, merfish, xenium  # noqa: F401
+
+    load_adapter_plugins()
+    return tuple(_REGISTERED_ADAPTERS.values())
+
+
 # Ensure built-in adapters are registered when the registry module is imported.
 from . import cosmx as _cosmx  # noqa: F401
 from . import merfish as _merfish  # noqa: F401
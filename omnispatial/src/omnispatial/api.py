@@ -73,7 +73,8 @@ def convert(
     image_chunks: Optional[Sequence[int]] = None,
     label_chunks: Optional[Sequence[int]] = None,
     compressor: Optional[str] = "zstd",
-    compression_level: int = 5,
+    compression_level: int = 1,
+    shuffle: str = "byte",
 ) -> ConversionResult:
     """Convert a spatial assay into NGFF or SpatialData formats."""
 
@@ -97,6 +98,7 @@ def convert(
             label_chunks=_normalise_chunks(label_chunks, 2),
             compressor=compressor,
             compression_level=compression_level,
+            shuffle=shuffle,
         )
     else:
         target = write_spatialdata(dataset, str(out_path))
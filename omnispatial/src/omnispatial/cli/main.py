@@ -97,8 +97,9 @@ def convert(
     dry_run: bool = typer.Option(False, "--dry-run", help="Run detection and validation without writing outputs."),
     image_chunks: Optional[str] = typer.Option(None, help="Image chunk size as comma-separated values, e.g. 1,256,256."),
     label_chunks: Optional[str] = typer.Option(None, help="Label chunk size as comma-separated values, e.g. 256,256."),
-    compressor: Optional[str] = typer.Option("zstd", help="Compression codec (zstd, lz4, zlib, snappy, none)."),
-    compression_level: int = typer.Option(5, help="Compression level (1-9)."),
+    compressor: Optional[str] = typer.Option("zstd", help="Compression codec (zstd, lz4, zlib, snappy, bitshuffle+lz4, none)."),
+    compression_level: int = typer.Option(1, help="Compression level (1-9)."),
+    shuffle: str = typer.Option("byte", help="Blosc shuffle filter (byte, bit, none)."),
 ) -> None:
     """Convert a spatial assay into NGFF or SpatialData bundles."""
     _configure_logging(verbose, log_json)
@@ -155,6 +156,7 @@ def convert(
                 label_chunks=lbl_chunks,
                 compressor=compressor,
                 compression_level=compression_level,
+                shuffle=shuffle,
             )
         else:
             target = write_spatialdata(dataset, str(out))
@@ -176,6 +178,7 @@ def validate(
         help="Bundle format: 'ngff' or 'spatialdata'.",
     ),
     json_report: Optional[Path] = typer.Option(None, "--json", help="Write machine-readable report to a JSON file."),
+    fail_fast: bool = typer.Option(False, "--fail-fast", help="Stop at the first error instead of collecting every issue."),
 ) -> None:
     """Validate a bundle and emit a machine-readable report."""
     fmt = output_format.lower()
@@ -184,7 +187,7 @@ def validate(
         raise typer.Exit(code=2)
 
     try:
-        report: ValidationResult = validate_bundle(bundle, fmt)
+        report: ValidationResult = validate_bundle(bundle, fmt, fail_fast=fail_fast)
     except ValidationIOError as exc:
         console.print(f"[bold red]Unable to read bundle:[/bold red] {exc}")
         raise typer.Exit(code=2) from exc
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import base64
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
-from pydantic import BaseModel, Field, field_validator, model_validator
-from shapely import wkt
+import shapely
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationInfo,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
 from shapely.geometry.base import BaseGeometry
 
-from omnispatial.utils.io import geometries_to_wkt
+from omnispatial.utils.io import geometries_from_wkb, geometries_from_wkt, geometries_to_wkb, geometries_to_wkt
 
 Matrix3x3 = Tuple[
     Tuple[float, float, float],
@@ -115,9 +123,14 @@ class LabelLayer(BaseModel):
     name: str
     frame: str
     crs: str = Field(..., description="Coordinate reference system identifier.")
-    geometries: List[str] = Field(
+    geometry_format: Literal["wkt", "wkb"] = Field(
+        default="wkt",
+        frozen=True,
+        description="Encoding of the stored geometries; fixed at construction.",
+    )
+    geometries: List[Union[str, bytes]] = Field(
         default_factory=list,
-        description="Geometries stored as WKT strings for portability.",
+        description="Geometries stored as WKT strings for portability, or WKB bytes for compactness.",
     )
     properties: Dict[str, object] = Field(
         default_factory=dict, description="Optional per-layer properties."
@@ -128,13 +141,39 @@ class LabelLayer(BaseModel):
 
     @field_validator("geometries", mode="before")
     @classmethod
-    def _ensure_wkt(cls, value: Iterable[BaseGeometry | str]) -> List[str]:
+    def _ensure_encoded(
+        cls, value: Iterable[BaseGeometry | str | bytes], info: ValidationInfo
+    ) -> List[str] | List[bytes]:
+        if info.data.get("geometry_format") == "wkb":
+            if info.mode == "json":
+                # JSON carries WKB base64-encoded; see _serialize_geometries.
+                value = [base64.b64decode(item) if isinstance(item, str) else item for item in value]
+            return geometries_to_wkb(value)
         return geometries_to_wkt(value)
 
+    @field_serializer("geometries", when_used="json")
+    def _serialize_geometries(self, geometries: List[Union[str, bytes]]) -> List[str]:
+        """Base64-encode WKB bytes, which are not valid UTF-8, for JSON output."""
+        if self.geometry_format == "wkb":
+            return [base64.b64encode(geometry).decode("ascii") for geometry in geometries]
+        return list(geometries)
+
     def iter_geometries(self) -> Iterable[BaseGeometry]:
-        """Yield Shapely geometries for the stored WKT strings."""
-        for geom_wkt in self.geometries:
-            yield wkt.loads(geom_wkt)
+        """Yield Shapely geometries for the stored WKT strings or WKB bytes."""
+        if self.geometry_format == "wkb":
+            yield from geometries_from_wkb(self.geometries)
+        else:
+            yield from geometries_from_wkt(self.geometries)
+
+    def __len__(self) -> int:
+        """Return the number of stored geometries without decoding them."""
+        return len(self.geometries)
+
+    def all_valid(self) -> bool:
+        """Return True when every stored geometry is valid, checked in one vectorised pass."""
+        encoded = np.asarray(self.geometries, dtype=object)
+        decoded = shapely.from_wkb(encoded) if self.geometry_format == "wkb" else shapely.from_wkt(encoded)
+        return bool(shapely.is_valid(decoded).all())
 
 
 class TableLayer(BaseModel):
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
 from napari_plugin_engine import napari_hook_implementation
 
 try:  # Optional napari imports
@@ -71,13 +75,44 @@ def _points_layer_from_table(adata: ad.AnnData, name: str) -> Optional[LayerData
     return (coordinates, metadata, "points")
 
 
-def _label_layers(path: Path, image_shape: Tuple[int, int]) -> Iterable[LayerDataTuple]:
+def _read_array(dataset: Any, max_workers: Optional[int] = None) -> np.ndarray:
+    """Read a chunked array, fetching and decoding chunks on a thread pool."""
+    shape = tuple(dataset.shape)
+    chunks = tuple(getattr(dataset, "chunks", None) or shape)
+    ranges = [range(0, dim, max(int(step), 1)) for dim, step in zip(shape, chunks)]
+    selections = [
+        tuple(slice(start, min(start + step, dim)) for start, step, dim in zip(starts, chunks, shape))
+        for starts in product(*ranges)
+    ]
+    if len(selections) <= 1:
+        return np.asarray(dataset[...])
+    output = np.empty(shape, dtype=dataset.dtype)
+    workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+
+    def _fetch(selection: Tuple[slice, ...]) -> None:
+        output[selection] = dataset[selection]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(_fetch, selections):
+            pass
+    return output
+
+
+def _open_array(dataset: Any, lazy: bool) -> Any:
+    if lazy:
+        import dask.array as da
+
+        return da.from_zarr(dataset)
+    return _read_array(dataset)
+
+
+def _label_layers(path: Path, image_shape: Tuple[int, int], lazy: bool = False) -> Iterable[LayerDataTuple]:
     labels_dir = zarr.open_group(str(path), mode="r")["labels"] if (path / "labels").exists() else None
     if labels_dir is None:
         return []
     layers: List[LayerDataTuple] = []
     for name in labels_dir.group_keys():
-        mask = labels_dir[name]["0"][:]
+        mask = _open_array(labels_dir[name]["0"], lazy)
         metadata = {"name": name}
         if mask.shape != image_shape:
             mask = mask.reshape(image_shape)
@@ -85,7 +120,8 @@ def _label_layers(path: Path, image_shape: Tuple[int, int]) -> Iterable[LayerDat
     return layers
 
 
-def omnispatial_reader(path: Any) -> Optional[LayerDataList]:  # napari reader signature
+def omnispatial_reader(path: Any, lazy: bool = False) -> Optional[LayerDataList]:  # napari reader signature
+    """Return napari layers for a bundle; ``lazy=True`` yields Dask arrays instead of decoding pixels."""
     bundle_path = _coerce_path(path)
     if not _is_omnispatial_bundle(bundle_path):
         return None
@@ -97,7 +133,7 @@ def omnispatial_reader(path: Any) -> Optional[LayerDataList]:  # napari reader s
 
     image_name = next(iter(images.group_keys()))
     image_dataset = images[image_name]["0"]
-    image = image_dataset[:]
+    image = _open_array(image_dataset, lazy)
     if image.ndim == 3 and image.shape[0] == 1:
         image = image[0]
     scale = None
@@ -118,7 +154,7 @@ def omnispatial_reader(path: Any) -> Optional[LayerDataList]:  # napari reader s
 
     layers: LayerDataList = [(image, metadata, "image")]
 
-    label_layers = list(_label_layers(bundle_path, image.shape[-2:]))
+    label_layers = list(_label_layers(bundle_path, image.shape[-2:], lazy))
     layers.extend(label_layers)
 
     adata = _load_table(bundle_path)
@@ -196,6 +232,11 @@ class OmniSpatialDock(QWidget):  # type: ignore[misc]
             storage["data"] = layer.data.copy()
             storage["properties"] = {key: np.asarray(value).copy() for key, value in layer.properties.items()}
 
+    def _unique_values(self, layer: "napari.layers.Points", property_name: str) -> np.ndarray:  # type: ignore[name-defined]
+        # napari hands out fresh property arrays on each access, so nothing is cached here.
+        # Hash-based pd.unique is linear; sorting only the distinct values keeps the combo ordered.
+        return np.sort(pd.unique(np.asarray(layer.properties[property_name])))
+
     def _on_layer_changed(self, _: str) -> None:
         if QWidget is object:  # pragma: no cover
             return
@@ -218,7 +259,7 @@ class OmniSpatialDock(QWidget):  # type: ignore[misc]
         self.value_combo.clear()
         if layer is None or property_name == "":
             return
-        values = np.unique(layer.properties[property_name])
+        values = self._unique_values(layer, property_name)
         for value in values:
             self.value_combo.addItem(str(value))
 
@@ -2,20 +2,31 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import math
+import os
 import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from itertools import product
 from pathlib import Path
 from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import numpy as np
+import shapely
 import tifffile
-from numcodecs import Blosc
+from numcodecs import Blosc, blosc
 from rasterio import features
-from shapely import wkt as shapely_wkt
-from shapely.geometry.base import BaseGeometry
 
-from omnispatial.core.model import AffineTransform, SpatialDataset
-from omnispatial.utils import read_image_any
+from omnispatial.core.model import AffineTransform, ImageLayer, LabelLayer, SpatialDataset
+from omnispatial.utils import read_image_any, read_image_lazy
+
+LOG = logging.getLogger(__name__)
+
+# Let Blosc use every core; this is process-wide, so it is set once at import.
+blosc.set_nthreads(os.cpu_count() or 1)
 
 
 class _ImageSource(NamedTuple):
@@ -25,9 +36,25 @@ class _ImageSource(NamedTuple):
     expanded: bool
 
 
+def _remove_tombstone(tombstone: Path) -> None:
+    try:
+        shutil.rmtree(tombstone)
+    except OSError as exc:
+        LOG.warning("Failed to delete stale output '%s': %s", tombstone, exc)
+
+
 def _ensure_parent(path: Path) -> None:
-    if path.exists():
-        shutil.rmtree(path)
+    if path.is_symlink() or path.is_file():
+        path.unlink()
+    elif path.exists():
+        # Rename the stale output out of the way and delete it while the new write proceeds.
+        tombstone = path.with_name(f"{path.name}.{uuid.uuid4().hex}.old")
+        try:
+            os.rename(path, tombstone)
+        except OSError:
+            shutil.rmtree(path)
+        else:
+            threading.Thread(target=_remove_tombstone, args=(tombstone,)).start()
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
@@ -38,28 +65,53 @@ def _extract_scale_translation(transform: AffineTransform) -> Tuple[List[float],
     return scale, translation
 
 
-def _rasterize_labels(geometries: Iterable[str], shape: Tuple[int, int]) -> np.ndarray:
-    """Rasterise polygon geometries into a label mask with uint32 dtype."""
+_POLYGONAL_TYPE_IDS = (3, 6)  # shapely.GeometryType.POLYGON, MULTIPOLYGON
+
+
+def _label_dtype(count: int) -> np.dtype:
+    if count < 2**8:
+        return np.dtype(np.uint8)
+    if count < 2**16:
+        return np.dtype(np.uint16)
+    return np.dtype(np.uint32)
+
+
+def _rasterize_labels(
+    geometries: Iterable[str | bytes],
+    shape: Tuple[int, int],
+    geometry_format: str = "wkt",
+) -> np.ndarray:
+    """Rasterise WKT or WKB polygons into the narrowest unsigned label mask that fits every label id."""
     height, width = shape
     if height <= 0 or width <= 0:
         raise ValueError("Raster shape must be positive and non-zero.")
 
-    shapes: List[Tuple[BaseGeometry, int]] = []
-    for index, geom_wkt in enumerate(geometries, start=1):
-        geometry = shapely_wkt.loads(geom_wkt)
-        if geometry.is_empty:
-            raise ValueError("Encountered empty geometry while rasterising labels.")
-        if geometry.geom_type not in {"Polygon", "MultiPolygon"}:
-            raise TypeError(f"Label geometry must be polygonal, received '{geometry.geom_type}'.")
-        shapes.append((geometry, index))
-
-    if not shapes:
-        return np.zeros(shape, dtype=np.uint32)
-
+    parse = shapely.from_wkb if geometry_format == "wkb" else shapely.from_wkt
+    parsed = parse(np.asarray(list(geometries), dtype=object))
+    dtype = _label_dtype(parsed.size)
+    if parsed.size == 0:
+        return np.zeros(shape, dtype=dtype)
+
+    if shapely.is_empty(parsed).any():
+        raise ValueError("Encountered empty geometry while rasterising labels.")
+    type_ids = shapely.get_type_id(parsed)
+    invalid = np.flatnonzero(~np.isin(type_ids, _POLYGONAL_TYPE_IDS))
+    if invalid.size:
+        geom_type = parsed[invalid[0]].geom_type
+        raise TypeError(f"Label geometry must be polygonal, received '{geom_type}'.")
+
+    # Geometries entirely outside the raster cannot burn any pixel; drop them before rasterio.
+    bounds = shapely.bounds(parsed)
+    inside = (bounds[:, 0] <= width) & (bounds[:, 1] <= height) & (bounds[:, 2] >= 0) & (bounds[:, 3] >= 0)
+    indices = np.flatnonzero(inside)
+    if indices.size == 0:
+        return np.zeros(shape, dtype=dtype)
+
+    shapes = zip(parsed[indices].tolist(), (indices + 1).tolist())
     mask = features.rasterize(
         shapes=shapes,
         out_shape=shape,
-        dtype="uint32",
+        dtype=dtype,
         fill=0,
         default_value=0,
         all_touched=True,
@@ -71,7 +123,8 @@ def _prepare_image_source(path: Path) -> _ImageSource:
     """Open an image resource for chunked reading."""
     suffix = path.suffix.lower()
     if suffix in {".tif", ".tiff"}:
-        array = tifffile.memmap(path)
+        # Read-only mapping: the default "r+" opens the source for writing and fails on read-only inputs.
+        array = tifffile.memmap(path, mode="r")
         shape = array.shape
         expanded = False
         if array.ndim == 2:
@@ -79,41 +132,14 @@ def _prepare_image_source(path: Path) -> _ImageSource:
             expanded = True
         return _ImageSource(data=array, shape=tuple(int(dim) for dim in shape), dtype=np.dtype(array.dtype), expanded=expanded)
 
-    if suffix == ".zarr" or path.is_dir():
-        import zarr  # local import to avoid mandatory dependency at module import
-
-        try:
-            store = zarr.open(str(path), mode="r")
-        except Exception:
-            store = None
-        array = None
-        if store is not None and hasattr(store, "shape"):
-            array = store
-        else:
-            group = zarr.open_group(str(path), mode="r")
-            array_keys = list(getattr(group, "array_keys", lambda: [])())
-            if not array_keys:
-                array_keys = [key for key in group]  # type: ignore[index]
-            if not array_keys:
-                raise ValueError(f"No arrays found in Zarr store: {path}")
-            first_key = sorted(array_keys)[0]
-            array = group[first_key]
-        shape = array.shape
-        expanded = False
-        if array.ndim == 2:
-            shape = (1, *shape)
-            expanded = True
-        return _ImageSource(data=array, shape=tuple(int(dim) for dim in shape), dtype=np.dtype(array.dtype), expanded=expanded)
-
-    data, _ = read_image_any(path)
+    # Zarr stores come back as lazy zarr.Array handles and are streamed chunk by chunk.
+    data, _ = read_image_any(path, lazy=True)
+    shape = data.shape
+    expanded = False
     if data.ndim == 2:
-        data = np.expand_dims(data, axis=0)
-    return _ImageSource(
-        data=data,
-        shape=tuple(int(dim) for dim in data.shape),
-        dtype=np.dtype(data.dtype),
-        expanded=False,
-    )
+        shape = (1, *shape)
+        expanded = True
+    return _ImageSource(data=data, shape=tuple(int(dim) for dim in shape), dtype=np.dtype(data.dtype), expanded=expanded)
 
 
 def _chunk_slices(shape: Tuple[int, ...], chunk_shape: Tuple[int, ...]) -> Iterator[Tuple[slice, ...]]:
@@ -157,32 +183,175 @@ def _resolve_chunks(
     for axis, dim in enumerate(shape):
         chunk[axis] = min(dim, min_chunk if axis >= len(shape) - 2 else dim)
 
-    def chunk_bytes() -> int:
-        total = 1
-        for value in chunk:
-            total *= max(1, value)
-        return total * dtype_size
-
-    while chunk_bytes() > target_bytes:
+    chunk = [max(1, value) for value in chunk]
+    # Track the chunk size incrementally so each halving re-checks the target without
+    # re-multiplying every axis.
+    total_bytes = math.prod(chunk) * dtype_size
+    while total_bytes > target_bytes:
         reduced = False
         for axis in range(len(chunk) - 1, -1, -1):
             if chunk[axis] > 1:
-                chunk[axis] = max(1, chunk[axis] // 2)
+                halved = chunk[axis] // 2
+                total_bytes = total_bytes // chunk[axis] * halved
+                chunk[axis] = halved
                 reduced = True
-                if chunk_bytes() <= target_bytes:
+                if total_bytes <= target_bytes:
                     break
         if not reduced:
             break
-    return tuple(max(1, value) for value in chunk)
+    return tuple(chunk)
 
 
-def _build_compressor(name: Optional[str], level: int) -> Optional[Blosc]:
+_SHUFFLE_MODES = {
+    "byte": Blosc.SHUFFLE,
+    "bit": Blosc.BITSHUFFLE,
+    "none": Blosc.NOSHUFFLE,
+}
+
+
+def _build_compressor(name: Optional[str], level: int, shuffle: str = "byte") -> Optional[Blosc]:
     if not name or name.lower() in {"none", "false"}:
         return None
     cname = name.lower()
+    if cname == "bitshuffle+lz4":
+        # Blosc ships the SIMD bitshuffle kernels, so the alias maps onto its lz4 + BITSHUFFLE pipeline.
+        cname, shuffle = "lz4", "bit"
     if cname not in {"zstd", "lz4", "zlib", "snappy"}:
         raise ValueError(f"Unsupported compressor '{name}'.")
-    return Blosc(cname=cname, clevel=max(1, min(level, 9)), shuffle=Blosc.BITSHUFFLE)
+    shuffle_mode = _SHUFFLE_MODES.get(shuffle.lower())
+    if shuffle_mode is None:
+        raise ValueError(f"Unsupported shuffle mode '{shuffle}'.")
+    return Blosc(cname=cname, clevel=max(1, min(level, 9)), shuffle=shuffle_mode)
+
+
+def _write_image(
+    image: ImageLayer,
+    source: _ImageSource,
+    images_group: Any,
+    image_chunks: Optional[Tuple[int, int, int]],
+    compressor_obj: Optional[Blosc],
+) -> None:
+    chunks = _resolve_chunks(source.shape, image_chunks, dtype_size=source.dtype.itemsize)
+    image_group = images_group.create_group(image.name)
+    try:
+        image_dataset = image_group.create_dataset(
+            "0",
+            shape=source.shape,
+            dtype=source.dtype,
+            chunks=chunks,
+            overwrite=True,
+            compressor=compressor_obj,
+            fill_value=0,
+            write_empty_chunks=False,
+        )
+    except ValueError:
+        fallback_chunks = _resolve_chunks(
+            source.shape,
+            None,
+            dtype_size=source.dtype.itemsize,
+            min_chunk=32,
+        )
+        image_dataset = image_group.create_dataset(
+            "0",
+            shape=source.shape,
+            dtype=source.dtype,
+            chunks=fallback_chunks,
+            overwrite=True,
+            compressor=compressor_obj,
+            fill_value=0,
+            write_empty_chunks=False,
+        )
+    _copy_source_to_zarr(source, image_dataset)
+    scale, translation = _extract_scale_translation(image.transform)
+    axes = [
+        {"name": "c", "type": "channel"},
+        {"name": "y", "type": "space", "unit": image.units},
+        {"name": "x", "type": "space", "unit": image.units},
+    ]
+    image_group.attrs["multiscales"] = [
+        {
+            "name": image.name,
+            "version": "0.4",
+            "axes": axes,
+            "datasets": [
+                {
+                    "path": "0",
+                    "coordinateTransformations": [
+                        {"type": "scale", "scale": scale},
+                        {"type": "translation", "translation": translation},
+                    ],
+                }
+            ],
+        }
+    ]
+
+
+def _write_label(
+    label: LabelLayer,
+    labels_group: Any,
+    reference_shape: Tuple[int, int],
+    label_chunks: Optional[Tuple[int, int]],
+    compressor_obj: Optional[Blosc],
+) -> None:
+    mask = _rasterize_labels(label.geometries, reference_shape, label.geometry_format)
+    label_group = labels_group.create_group(label.name)
+    chunks = label_chunks or _resolve_chunks(
+        mask.shape,
+        None,
+        dtype_size=mask.dtype.itemsize,
+        min_chunk=128,
+    )
+    try:
+        label_group.create_dataset(
+            "0",
+            data=mask,
+            chunks=chunks,
+            overwrite=True,
+            compressor=compressor_obj,
+            fill_value=0,
+            write_empty_chunks=False,
+        )
+    except ValueError:
+        fallback_chunks = _resolve_chunks(
+            mask.shape,
+            None,
+            dtype_size=mask.dtype.itemsize,
+            min_chunk=64,
+        )
+        label_group.create_dataset(
+            "0",
+            data=mask,
+            chunks=fallback_chunks,
+            overwrite=True,
+            compressor=compressor_obj,
+            fill_value=0,
+            write_empty_chunks=False,
+        )
+    scale, translation = _extract_scale_translation(label.transform)
+    axes = [
+        {"name": "y", "type": "space", "unit": label.transform.units},
+        {"name": "x", "type": "space", "unit": label.transform.units},
+    ]
+    label_group.attrs["image-label"] = {
+        "version": "0.4",
+        "source": {"image": {"path": "../images"}},
+    }
+    label_group.attrs["multiscales"] = [
+        {
+            "name": label.name,
+            "version": "0.4",
+            "axes": axes,
+            "datasets": [
+                {
+                    "path": "0",
+                    "coordinateTransformations": [
+                        {"type": "scale", "scale": scale[1:]},
+                        {"type": "translation", "translation": translation[1:]},
+                    ],
+                }
+            ],
+        }
+    ]
 
 
 def write_ngff(
@@ -192,7 +361,8 @@ def write_ngff(
     image_chunks: Optional[Tuple[int, int, int]] = None,
     label_chunks: Optional[Tuple[int, int]] = None,
     compressor: Optional[str] = "zstd",
-    compression_level: int = 5,
+    compression_level: int = 1,
+    shuffle: str = "byte",
 ) -> str:
     """Write the spatial dataset to an NGFF Zarr store."""
     import anndata as ad
@@ -205,126 +375,40 @@ def write_ngff(
     images_group = root.create_group("images")
     labels_group = root.create_group("labels")
     tables_group = root.create_group("tables")
-    compressor_obj = _build_compressor(compressor, compression_level)
+    compressor_obj = _build_compressor(compressor, compression_level, shuffle)
     provenance = dataset.provenance.model_dump() if dataset.provenance else {}
     root.attrs["omnispatial_provenance"] = provenance
 
-    first_image_shape: Tuple[int, int] | None = None
-
+    sources: List[_ImageSource] = []
     for image in dataset.images:
         if image.path is None:
             raise ValueError("ImageLayer requires a concrete file path to write NGFF output.")
-        source = _prepare_image_source(Path(image.path))
-        chunks = _resolve_chunks(source.shape, image_chunks, dtype_size=source.dtype.itemsize)
-        image_group = images_group.create_group(image.name)
-        try:
-            image_dataset = image_group.create_dataset(
-                "0",
-                shape=source.shape,
-                dtype=source.dtype,
-                chunks=chunks,
-                overwrite=True,
-                compressor=compressor_obj,
-            )
-        except ValueError:
-            fallback_chunks = _resolve_chunks(
-                source.shape,
-                None,
-                dtype_size=source.dtype.itemsize,
-                min_chunk=32,
-            )
-            image_dataset = image_group.create_dataset(
-                "0",
-                shape=source.shape,
-                dtype=source.dtype,
-                chunks=fallback_chunks,
-                overwrite=True,
-                compressor=compressor_obj,
-            )
-        _copy_source_to_zarr(source, image_dataset)
-        scale, translation = _extract_scale_translation(image.transform)
-        axes = [
-            {"name": "c", "type": "channel"},
-            {"name": "y", "type": "space", "unit": image.units},
-            {"name": "x", "type": "space", "unit": image.units},
-        ]
-        image_group.attrs["multiscales"] = [
-            {
-                "name": image.name,
-                "version": "0.4",
-                "axes": axes,
-                "datasets": [
-                    {
-                        "path": "0",
-                        "coordinateTransformations": [
-                            {"type": "scale", "scale": scale},
-                            {"type": "translation", "translation": translation},
-                        ],
-                    }
-                ],
-            }
-        ]
-        first_image_shape = source.shape[-2:]
-
-    if dataset.labels:
-        if first_image_shape is None:
-            raise ValueError("Writing labels requires at least one image to define the reference shape.")
-        for label in dataset.labels:
-            mask = _rasterize_labels(label.geometries, first_image_shape)
-            label_group = labels_group.create_group(label.name)
-            chunks = label_chunks or _resolve_chunks(
-                mask.shape,
-                None,
-                dtype_size=mask.dtype.itemsize,
-                min_chunk=128,
-            )
-            try:
-                label_group.create_dataset(
-                    "0",
-                    data=mask,
-                    chunks=chunks,
-                    overwrite=True,
-                    compressor=compressor_obj,
-                )
-            except ValueError:
-                fallback_chunks = _resolve_chunks(
-                    mask.shape,
-                    None,
-                    dtype_size=mask.dtype.itemsize,
-                    min_chunk=64,
-                )
-                label_group.create_dataset(
-                    "0",
-                    data=mask,
-                    chunks=fallback_chunks,
-                    overwrite=True,
-                    compressor=compressor_obj,
-                )
-            scale, translation = _extract_scale_translation(label.transform)
-            axes = [
-                {"name": "y", "type": "space", "unit": label.transform.units},
-                {"name": "x", "type": "space", "unit": label.transform.units},
-            ]
-            label_group.attrs["image-label"] = {
-                "version": "0.4",
-                "source": {"image": {"path": "../images"}},
-            }
-            label_group.attrs["multiscales"] = [
-                {
-                    "name": label.name,
-                    "version": "0.4",
-                    "axes": axes,
-                    "datasets": [
-                        {
-                            "path": "0",
-                            "coordinateTransformations": [
-                                {"type": "scale", "scale": scale[1:]},
-                                {"type": "translation", "translation": translation[1:]},
-                            ],
-                        }
-                    ],
-                }
+        sources.append(_prepare_image_source(Path(image.path)))
+
+    if dataset.labels and not sources:
+        raise ValueError("Writing labels requires at least one image to define the reference shape.")
+
+    # Layers are independent Zarr arrays and Blosc releases the GIL, so they compress concurrently.
+    layer_count = len(sources) + len(dataset.labels)
+    if layer_count:
+        with ThreadPoolExecutor(max_workers=min(layer_count, os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(_write_image, image, source, images_group, image_chunks, compressor_obj)
+                for image, source in zip(dataset.images, sources)
             ]
+            futures.extend(
+                executor.submit(
+                    _write_label,
+                    label,
+                    labels_group,
+                    sources[0].shape[-2:],
+                    label_chunks,
+                    compressor_obj,
+                )
+                for label in dataset.labels
+            )
+            for future in futures:
+                future.result()
 
     for table in dataset.tables:
         if table.adata_path is None:
@@ -343,7 +427,6 @@ def write_spatialdata(dataset: SpatialDataset, out_path: str) -> str:
     from spatialdata import SpatialData
     from spatialdata.io import write_zarr
     from spatialdata.models import Image2DModel, Labels2DModel, TableModel
-    import zarr
 
     output = Path(out_path)
     _ensure_parent(output)
@@ -354,9 +437,9 @@ def write_spatialdata(dataset: SpatialDataset, out_path: str) -> str:
     image = dataset.images[0]
     if image.path is None:
         raise ValueError("ImageLayer requires a concrete file path to write SpatialData output.")
-    image_data, _ = read_image_any(Path(image.path))
+    image_data = read_image_lazy(Path(image.path))
     if image_data.ndim == 2:
-        image_data = np.expand_dims(image_data, axis=0)
+        image_data = image_data[np.newaxis, ...]
     scale, translation = _extract_scale_translation(image.transform)
     # scale list includes channel axis; drop leading element for spatial axes when constructing model.
     image_da = xr.DataArray(image_data, dims=("c", "y", "x"))
@@ -366,7 +449,7 @@ def write_spatialdata(dataset: SpatialDataset, out_path: str) -> str:
     if dataset.labels:
         mask_shape = image_data.shape[-2:]
         for label in dataset.labels:
-            mask = _rasterize_labels(label.geometries, mask_shape)
+            mask = _rasterize_labels(label.geometries, mask_shape, label.geometry_format)
             lbl_scale, lbl_translation = _extract_scale_translation(label.transform)
             labels_da = xr.DataArray(mask, dims=("y", "x"))
             labels_model = Labels2DModel.parse(
@@ -390,10 +473,17 @@ def write_spatialdata(dataset: SpatialDataset, out_path: str) -> str:
         table_obj = TableModel.parse(adata, region=adata.obs["region"].iloc[0], region_key="region_key")
 
     sdata = SpatialData(images={image.name: image_model}, labels=labels_model_dict, table=table_obj)
+    provenance = dataset.provenance.model_dump(mode="json") if dataset.provenance else None
+    sdata_attrs = getattr(sdata, "attrs", None)
+    if provenance is not None and sdata_attrs is not None:
+        sdata_attrs["omnispatial_provenance"] = provenance
     write_zarr(sdata, str(output), overwrite=True)
-    root = zarr.open_group(str(output), mode="a")
-    if dataset.provenance:
-        root.attrs["omnispatial_provenance"] = dataset.provenance.model_dump()
+    if provenance is not None and sdata_attrs is None:
+        # Older SpatialData releases have no root attrs; patch .zattrs directly rather than reopening the group.
+        attrs_path = output / ".zattrs"
+        attrs = json.loads(attrs_path.read_text(encoding="utf-8")) if attrs_path.exists() else {}
+        attrs["omnispatial_provenance"] = provenance
+        attrs_path.write_text(json.dumps(attrs), encoding="utf-8")
     return str(output)
 
 
@@ -2,26 +2,36 @@
 
 from .io import (
     dataframe_summary,
+    geometries_from_wkb,
     geometries_from_wkt,
+    geometries_to_wkb,
     geometries_to_wkt,
     load_spatial_table,
     load_tabular_file,
     load_yaml,
     polygons_from_wkt,
+    probe_image_shape,
     read_image_any,
+    read_image_lazy,
     read_table_csv,
+    tabular_columns,
     temporary_output_path,
 )
 
 __all__ = [
     "dataframe_summary",
+    "geometries_from_wkb",
     "geometries_from_wkt",
+    "geometries_to_wkb",
     "geometries_to_wkt",
     "load_spatial_table",
     "load_tabular_file",
     "load_yaml",
     "polygons_from_wkt",
+    "probe_image_shape",
     "read_image_any",
+    "read_image_lazy",
     "read_table_csv",
+    "tabular_columns",
     "temporary_output_path",
 ]
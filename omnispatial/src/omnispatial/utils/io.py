@@ -4,20 +4,26 @@ from __future__ import annotations
 
 from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import tempfile
 import uuid
+import weakref
 
 import numpy as np
 import pandas as pd
+import shapely
 import tifffile
 import yaml
 import zarr
 from pandas import DataFrame
 from pandas.api.types import is_numeric_dtype
-from shapely import wkt
 from shapely.geometry.base import BaseGeometry
 
+if TYPE_CHECKING:  # pragma: no cover
+    import dask.array as da
+
+_POLYGONAL_TYPE_IDS = (3, 6)  # shapely.GeometryType.POLYGON, MULTIPOLYGON
+
 
 def load_yaml(path: Path) -> dict:
     """Load a YAML file into a dictionary."""
@@ -30,13 +36,110 @@ def _stat_signature(path: Path) -> Tuple[int, float]:
     return (stat.st_size, stat.st_mtime)
 
 
+# pd.read_csv's default ``na_values`` as documented; spelled out rather than imported from pandas internals.
+_CSV_NA_VALUES = (
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+)
+
+
+def _dedup_header(names: Sequence[str]) -> List[str]:
+    """Rename repeated column names to ``name.1``, ``name.2``, ... the way ``pd.read_csv`` does."""
+    header = list(names)
+    counts: Dict[str, int] = {}
+    for index, name in enumerate(header):
+        column = name
+        count = counts.get(column, 0)
+        while count > 0:
+            counts[name] = count + 1
+            column = f"{name}.{count}"
+            count = count + 1 if column in header else counts.get(column, 0)
+        header[index] = column
+        counts[column] = counts.get(column, 0) + 1
+    return header
+
+
+def _delimited_header(path: Path, delimiter: str) -> Tuple[List[str], Dict[str, Any]]:
+    """Return the de-duplicated header of a delimited file and the Arrow type of each column."""
+    from pyarrow import csv as pa_csv
+
+    reader = pa_csv.open_csv(path, parse_options=pa_csv.ParseOptions(delimiter=delimiter))
+    try:
+        schema = reader.schema
+    finally:
+        reader.close()
+    names = _dedup_header(schema.names)
+    return names, dict(zip(names, schema.types))
+
+
+def _read_delimited(path: Path, delimiter: str, columns: Optional[Tuple[str, ...]]) -> DataFrame:
+    """Parse a delimited file with Arrow's multithreaded reader, matching ``pd.read_csv`` values."""
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+
+    names, types = _delimited_header(path, delimiter)
+    # pandas never infers dates, so any column Arrow would read as temporal stays text.
+    temporal = {
+        name: pa.string()
+        for name, field_type in types.items()
+        if pa.types.is_temporal(field_type) and (columns is None or name in columns)
+    }
+    table = pa_csv.read_csv(
+        path,
+        # Supplying the de-duplicated names keeps repeated headers readable, as pandas does.
+        read_options=pa_csv.ReadOptions(use_threads=True, column_names=names, skip_rows=1),
+        parse_options=pa_csv.ParseOptions(delimiter=delimiter),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=list(columns) if columns is not None else None,
+            column_types=temporal,
+            null_values=list(_CSV_NA_VALUES),
+            strings_can_be_null=True,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+        ),
+    )
+    df = table.to_pandas()
+    # Arrow yields None for missing text; pandas uses NaN.
+    for name in df.columns[df.dtypes == object]:
+        df[name] = df[name].where(df[name].notna(), np.nan)
+    return df
+
+
 @lru_cache(maxsize=32)
-def _read_tabular_cached(suffix: str, signature: Tuple[int, float], path_str: str) -> DataFrame:
+def _read_tabular_cached(
+    suffix: str,
+    signature: Tuple[int, float],
+    path_str: str,
+    columns: Optional[Tuple[str, ...]] = None,
+) -> DataFrame:
     path = Path(path_str)
     if suffix in {".csv", ".tsv"}:
-        df = pd.read_csv(path)
+        df = _read_delimited(path, "\t" if suffix == ".tsv" else ",", columns)
     elif suffix in {".parquet", ".pq"}:
-        df = pd.read_parquet(path)
+        from pyarrow import parquet as pa_parquet
+
+        df = pa_parquet.read_table(
+            path,
+            columns=list(columns) if columns is not None else None,
+            use_threads=True,
+        ).to_pandas()
     else:
         raise ValueError(f"Unsupported tabular format for file: {path}")
     if df.empty:
@@ -44,13 +147,31 @@ def _read_tabular_cached(suffix: str, signature: Tuple[int, float], path_str: st
     return df
 
 
-def load_tabular_file(path: Path) -> DataFrame:
-    """Load a CSV, TSV, or Parquet file into a DataFrame with basic validation."""
+def load_tabular_file(path: Path, columns: Optional[Sequence[str]] = None) -> DataFrame:
+    """Load a CSV, TSV, or Parquet file into a DataFrame with basic validation.
+
+    When ``columns`` is given only those columns are parsed, in that order.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Tabular file does not exist: {path}")
     suffix = path.suffix.lower()
     signature = _stat_signature(path)
-    return _read_tabular_cached(suffix, signature, str(path)).copy()
+    selected = tuple(columns) if columns is not None else None
+    return _read_tabular_cached(suffix, signature, str(path), selected).copy()
+
+
+def tabular_columns(path: Path) -> List[str]:
+    """Return the column names of a CSV, TSV, or Parquet file without reading its rows."""
+    if not path.exists():
+        raise FileNotFoundError(f"Tabular file does not exist: {path}")
+    suffix = path.suffix.lower()
+    if suffix in {".csv", ".tsv"}:
+        return _delimited_header(path, "\t" if suffix == ".tsv" else ",")[0]
+    if suffix in {".parquet", ".pq"}:
+        from pyarrow import parquet as pa_parquet
+
+        return list(pa_parquet.read_schema(path).names)
+    raise ValueError(f"Unsupported tabular format for file: {path}")
 
 
 def load_spatial_table(path: Path, coordinate_columns: Sequence[str] = ("x", "y")) -> DataFrame:
@@ -74,30 +195,58 @@ def dataframe_summary(df: DataFrame) -> dict:
 def geometries_to_wkt(geometries: Iterable[BaseGeometry | str]) -> List[str]:
     """Normalise a set of geometries to WKT strings."""
     serialised: List[str] = []
+    pending: List[str] = []
     for geometry in geometries:
         if isinstance(geometry, BaseGeometry):
             serialised.append(geometry.wkt)
         elif isinstance(geometry, str):
-            # Validate string serialisation
-            wkt.loads(geometry)
+            pending.append(geometry)
             serialised.append(geometry)
         else:
             raise TypeError("Geometries must be shapely geometries or WKT strings.")
+    if pending:
+        # Validate string serialisation in a single vectorised parse
+        shapely.from_wkt(np.asarray(pending, dtype=object))
+    return serialised
+
+
+def geometries_to_wkb(geometries: Iterable[BaseGeometry | bytes]) -> List[bytes]:
+    """Normalise a set of geometries to WKB bytes."""
+    serialised: List[bytes] = []
+    pending: List[bytes] = []
+    for geometry in geometries:
+        if isinstance(geometry, BaseGeometry):
+            serialised.append(shapely.to_wkb(geometry))
+        elif isinstance(geometry, bytes):
+            pending.append(geometry)
+            serialised.append(geometry)
+        else:
+            raise TypeError("Geometries must be shapely geometries or WKB bytes.")
+    if pending:
+        shapely.from_wkb(np.asarray(pending, dtype=object))
     return serialised
 
 
+def _geometry_array_from_wkt(wkt_strings: Iterable[str]) -> np.ndarray:
+    return shapely.from_wkt(np.asarray(list(wkt_strings), dtype=object))
+
+
 def geometries_from_wkt(wkt_strings: Iterable[str]) -> List[BaseGeometry]:
     """Materialise WKT strings as Shapely geometries."""
-    return [wkt.loads(value) for value in wkt_strings]
+    return _geometry_array_from_wkt(wkt_strings).tolist()
+
+
+def geometries_from_wkb(wkb_values: Iterable[bytes]) -> List[BaseGeometry]:
+    """Materialise WKB bytes as Shapely geometries."""
+    return shapely.from_wkb(np.asarray(list(wkb_values), dtype=object)).tolist()
 
 
 def polygons_from_wkt(wkt_strings: Iterable[str]) -> List[BaseGeometry]:
     """Return geometries from WKT and ensure they are polygonal."""
-    geometries = [wkt.loads(value) for value in wkt_strings]
-    for geometry in geometries:
-        if geometry.geom_type not in {"Polygon", "MultiPolygon"}:
-            raise TypeError("Expected polygonal geometry in WKT string.")
-    return geometries
+    geometries = _geometry_array_from_wkt(wkt_strings)
+    if not np.isin(shapely.get_type_id(geometries), _POLYGONAL_TYPE_IDS).all():
+        raise TypeError("Expected polygonal geometry in WKT string.")
+    return geometries.tolist()
 
 
 def read_table_csv(path: Path) -> DataFrame:
@@ -107,13 +256,20 @@ def read_table_csv(path: Path) -> DataFrame:
     return load_tabular_file(path)
 
 
-def read_image_any(path: Path) -> Tuple[np.ndarray, dict]:
-    """Load a TIFF or Zarr array and return the numpy data and metadata."""
+def read_image_any(path: Path, *, lazy: bool = False) -> Tuple[np.ndarray | zarr.Array, dict]:
+    """Load a TIFF, PNG/JPEG or Zarr image and return the data and metadata.
+
+    Set ``lazy`` to get Zarr inputs back as the on-disk :class:`zarr.Array` instead of an ndarray.
+    """
     if not path.exists():
         raise FileNotFoundError(f"Image resource not found: {path}")
     suffix = path.suffix.lower()
     if suffix in {".tif", ".tiff"}:
-        data = tifffile.imread(path)
+        try:
+            # Uncompressed TIFFs map straight onto the page cache without an in-RAM copy.
+            data = tifffile.memmap(path, mode="r")
+        except ValueError:
+            data = tifffile.imread(path)
         return np.asarray(data), {"format": "tiff"}
     if suffix in {".png", ".jpg", ".jpeg"}:
         try:
@@ -124,20 +280,56 @@ def read_image_any(path: Path) -> Tuple[np.ndarray, dict]:
         return np.asarray(data), {"format": suffix.lstrip(".")}
     if suffix in {".zarr"} or path.is_dir():
         store = zarr.open(path, mode="r")
-        if hasattr(store, "shape"):
-            data = np.asarray(store)
-        else:
+        if not hasattr(store, "shape"):
             array_keys = list(getattr(store, "array_keys", lambda: [])())
             if not array_keys:
                 array_keys = [key for key in store]  # type: ignore[index]
             if not array_keys:
                 raise ValueError(f"No arrays found in Zarr store: {path}")
             first_key = sorted(array_keys)[0]
-            data = np.asarray(store[first_key])
-        return data, {"format": "zarr"}
+            store = store[first_key]
+        return (store if lazy else np.asarray(store)), {"format": "zarr"}
     raise ValueError(f"Unsupported image format for: {path}")
 
 
+def read_image_lazy(path: Path, chunks: Optional[Tuple[int, ...]] = None) -> "da.Array":
+    """Open a TIFF, PNG/JPEG or Zarr image as a chunked Dask array without loading it."""
+    import dask.array as da
+
+    if not path.exists():
+        raise FileNotFoundError(f"Image resource not found: {path}")
+    if path.suffix.lower() in {".tif", ".tiff"}:
+        try:
+            data = da.from_array(tifffile.memmap(path, mode="r"), chunks="auto")
+        except ValueError:
+            # Compressed or tiled TIFFs cannot be memory-mapped; decode them through the Zarr view.
+            tiff_store = tifffile.imread(path, aszarr=True)
+            node = zarr.open(tiff_store, mode="r")
+            array = node if hasattr(node, "shape") else node["0"]
+            # The store holds the TIFF file open; release it once the array (and any Dask
+            # graph built on it) is garbage collected.
+            weakref.finalize(array, tiff_store.close)
+            data = da.from_zarr(array)
+    else:
+        source, _ = read_image_any(path, lazy=True)
+        data = da.from_zarr(source) if isinstance(source, zarr.Array) else da.from_array(source)
+    if chunks is not None:
+        data = data.rechunk(chunks)
+    return data
+
+
+def probe_image_shape(path: Path) -> Tuple[int, ...]:
+    """Return the shape of an image without decoding its pixels where the format allows it."""
+    if not path.exists():
+        raise FileNotFoundError(f"Image resource not found: {path}")
+    if path.suffix.lower() in {".tif", ".tiff"}:
+        with tifffile.TiffFile(path) as tif:
+            return tuple(tif.series[0].shape)
+    # Zarr sources come back as on-disk arrays, so only their metadata is read here.
+    source, _ = read_image_any(path, lazy=True)
+    return tuple(source.shape)
+
+
 _SCRATCH_DIR: Path | None = None
 
 
@@ -163,13 +355,18 @@ def temporary_output_path(*, stem: str | None = None, suffix: str = "") -> Path:
 
 __all__ = [
     "dataframe_summary",
+    "geometries_from_wkb",
     "geometries_from_wkt",
+    "geometries_to_wkb",
     "geometries_to_wkt",
     "polygons_from_wkt",
+    "probe_image_shape",
     "load_spatial_table",
     "load_tabular_file",
     "load_yaml",
     "read_table_csv",
     "read_image_any",
+    "read_image_lazy",
+    "tabular_columns",
     "temporary_output_path",
 ]
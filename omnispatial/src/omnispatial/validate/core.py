@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 import jsonschema
+import numpy as np
 
 
 @dataclass
@@ -18,12 +21,68 @@ class ValidationItem:
     detail: str
 
 
-@dataclass
+def _object_array(values: Iterable[str]) -> np.ndarray:
+    values = list(values)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+@dataclass(init=False, eq=False)
 class ValidationReport:
-    """Collection of validation items."""
+    """Collection of validation results stored column-wise."""
 
     target: Path
-    items: List[ValidationItem]
+    names: np.ndarray
+    statuses: np.ndarray
+    details: np.ndarray
+
+    def __init__(
+        self,
+        target: Path,
+        items: Optional[Iterable[ValidationItem]] = None,
+        *,
+        names: Optional[np.ndarray] = None,
+        statuses: Optional[np.ndarray] = None,
+        details: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize the report from row-wise ``items`` or from column arrays."""
+        self.target = target
+        if items is not None:
+            self.items = items
+        else:
+            self.names = names if names is not None else _object_array([])
+            self.statuses = statuses if statuses is not None else _object_array([])
+            self.details = details if details is not None else _object_array([])
+
+    @classmethod
+    def from_items(cls, target: Path, items: Iterable[ValidationItem]) -> "ValidationReport":
+        """Build a report from row-wise validation items."""
+        return cls(target, items)
+
+    @property
+    def items(self) -> List[ValidationItem]:
+        """Return the results as :class:`ValidationItem` rows."""
+        return [
+            ValidationItem(name=name, status=status, detail=detail)
+            for name, status, detail in zip(self.names, self.statuses, self.details)
+        ]
+
+    @items.setter
+    def items(self, items: Iterable[ValidationItem]) -> None:
+        items = list(items)
+        self.names = _object_array(item.name for item in items)
+        self.statuses = _object_array(item.status for item in items)
+        self.details = _object_array(item.detail for item in items)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValidationReport):
+            return NotImplemented
+        return self.target == other.target and self.items == other.items
+
+    def count(self, status: str) -> int:
+        """Return the number of results with the given status."""
+        return int(np.count_nonzero(self.statuses == status))
 
     @classmethod
     def example(cls, bundle: Path, schema_path: Optional[Path]) -> "ValidationReport":
@@ -33,17 +92,34 @@ class ValidationReport:
             ValidationItem(name="structure", status="PASS", detail="Zarr hierarchy reachable"),
             ValidationItem(name="schema", status="INFO", detail=detail),
         ]
-        return cls(target=bundle, items=items)
+        return cls.from_items(bundle, items)
+
+
+@lru_cache(maxsize=32)
+def _make_validator(schema_key: str) -> jsonschema.Draft202012Validator:
+    schema = json.loads(schema_key)
+    jsonschema.Draft202012Validator.check_schema(schema)
+    return jsonschema.Draft202012Validator(schema)
+
+
+def _root_attributes(bundle: Path) -> dict:
+    attrs_path = Path(bundle) / ".zattrs"
+    if not attrs_path.is_file():
+        return {}
+    return json.loads(attrs_path.read_text())
 
 
 def validate_store(bundle: Path, schema: Optional[dict] = None) -> ValidationReport:
-    """Validate a bundle with an optional JSON schema."""
+    """Validate a bundle's root attributes with an optional JSON schema."""
     schema = schema or {"type": "object"}
-    jsonschema.Draft202012Validator.check_schema(schema)
-    items: Iterable[ValidationItem] = [
-        ValidationItem(name="schema", status="PASS", detail="Validated against schema."),
-    ]
-    return ValidationReport(target=bundle, items=list(items))
+    validator = _make_validator(json.dumps(schema, sort_keys=True))
+    errors = list(validator.iter_errors(_root_attributes(bundle)))
+    items: Iterable[ValidationItem]
+    if errors:
+        items = [ValidationItem(name="schema", status="FAIL", detail=error.message) for error in errors]
+    else:
+        items = [ValidationItem(name="schema", status="PASS", detail="Validated against schema.")]
+    return ValidationReport.from_items(bundle, items)
 
 
 __all__ = ["ValidationItem", "ValidationReport", "validate_store"]
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import json
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import anndata as ad
 import numpy as np
+import pandas as pd
 import zarr
 from pydantic import BaseModel, Field
 
@@ -56,107 +60,311 @@ class ValidationIOError(RuntimeError):
     """Raised when validation cannot operate due to IO errors."""
 
 
-def _add_issue(issues: List[ValidationIssue], code: str, message: str, path: str, severity: Severity) -> None:
-    issues.append(ValidationIssue(code=code, message=message, path=path, severity=severity))
+class _FailFast(Exception):
+    """Internal signal used to abort validation at the first error."""
 
 
-def _validate_multiscales(
-    group: zarr.hierarchy.Group,
-    group_path: str,
-    issues: List[ValidationIssue],
+# Issues are buffered as (code, message, path, severity) tuples and turned into models once at the end.
+_IssueTemplate = Tuple[str, str, str, Severity]
+_MAX_VALIDATION_WORKERS = 8
+
+
+class _IssueList(List[_IssueTemplate]):
+    def __init__(self, *, fail_fast: bool = False) -> None:
+        super().__init__()
+        self.fail_fast = fail_fast
+
+
+def _add_issue(issues: List[_IssueTemplate], code: str, message: str, path: str, severity: Severity) -> None:
+    issues.append((code, message, path, severity))
+    if severity is Severity.ERROR and getattr(issues, "fail_fast", False):
+        raise _FailFast
+
+
+@lru_cache(maxsize=128)
+def _validate_multiscales_meta(
+    multiscales_key: str,
+    present_paths: Tuple[bool, ...],
     expect_channel_axis: bool,
-) -> List[float]:
-    multiscales = group.attrs.get("multiscales")
-    if not multiscales:
-        _add_issue(issues, "NGFF_METADATA_MISSING", "Missing multiscales metadata.", group_path, Severity.ERROR)
-        return []
-    entry = multiscales[0]
+) -> Tuple[_IssueTemplate, ...]:
+    """Check a multiscales entry, returning issues with paths relative to the group path."""
+    entry = json.loads(multiscales_key)[0]
     axes = entry.get("axes", [])
-    prev_scale: Optional[List[float]] = None
-    reported_scale: List[float] = []
-    for axis_index, axis in enumerate(axes):
-        if axis.get("type") == "space" and "unit" not in axis:
-            _add_issue(
-                issues,
-                "NGFF_AXIS_UNIT_MISSING",
-                f"Axis '{axis.get('name', axis_index)}' is missing a unit.",
-                group_path,
-                Severity.ERROR,
-            )
-    for dataset in entry.get("datasets", []):
-        path = dataset.get("path")
-        if path is None or path not in group:
-            _add_issue(
-                issues,
-                "NGFF_DATASET_MISSING",
-                "Dataset entry does not exist in Zarr group.",
-                f"{group_path}/{path or ''}",
-                Severity.ERROR,
+    issues: List[_IssueTemplate] = []
+    prev_scale: Optional[np.ndarray] = None
+    non_invertible = False
+    issues.extend(
+        ("NGFF_AXIS_UNIT_MISSING", f"Axis '{axis.get('name', axis_index)}' is missing a unit.", "", Severity.ERROR)
+        for axis_index, axis in enumerate(axes)
+        if axis.get("type") == "space" and "unit" not in axis
+    )
+    for dataset, present in zip(entry.get("datasets", []), present_paths):
+        dataset_path = f"/{dataset.get('path') or ''}"
+        if not present:
+            issues.append(
+                (
+                    "NGFF_DATASET_MISSING",
+                    "Dataset entry does not exist in Zarr group.",
+                    dataset_path,
+                    Severity.ERROR,
+                )
             )
             continue
         transforms = dataset.get("coordinateTransformations", [])
-        scale_transform = next((t for t in transforms if t.get("type") == "scale"), None)
-        translation_transform = next((t for t in transforms if t.get("type") == "translation"), None)
+        scale_transform = translation_transform = None
+        for transform in transforms:
+            transform_type = transform.get("type")
+            if transform_type == "scale" and scale_transform is None:
+                scale_transform = transform
+            elif transform_type == "translation" and translation_transform is None:
+                translation_transform = transform
         if scale_transform is None:
-            _add_issue(
-                issues,
-                "NGFF_SCALE_MISSING",
-                "Scale transform missing for dataset.",
-                f"{group_path}/{path}",
-                Severity.ERROR,
-            )
+            issues.append(("NGFF_SCALE_MISSING", "Scale transform missing for dataset.", dataset_path, Severity.ERROR))
             continue
-        scale = [float(value) for value in scale_transform.get("scale", [])]
+        scale = np.asarray(scale_transform.get("scale", []), dtype=np.float64)
         if expect_channel_axis and len(scale) < 3:
-            _add_issue(
-                issues,
-                "NGFF_SCALE_DIMENSION_MISMATCH",
-                "Scale vector expected to include channel axis.",
-                f"{group_path}/{path}",
-                Severity.ERROR,
-            )
-        if any(value <= 0 for value in scale):
-            _add_issue(
-                issues,
-                "NGFF_SCALE_NON_POSITIVE",
-                "Scale factors must be positive.",
-                f"{group_path}/{path}",
-                Severity.ERROR,
+            issues.append(
+                (
+                    "NGFF_SCALE_DIMENSION_MISMATCH",
+                    "Scale vector expected to include channel axis.",
+                    dataset_path,
+                    Severity.ERROR,
+                )
             )
+        if (scale <= 0).any():
+            issues.append(("NGFF_SCALE_NON_POSITIVE", "Scale factors must be positive.", dataset_path, Severity.ERROR))
+            # A non-positive image scale also makes the group's transform non-invertible; report that once.
+            if expect_channel_axis and not non_invertible:
+                non_invertible = True
+                issues.append(
+                    (
+                        "NGFF_TRANSFORM_NON_INVERTIBLE",
+                        "Image scale contains non-positive values, making transform non-invertible.",
+                        "",
+                        Severity.ERROR,
+                    )
+                )
         spatial_scale = scale[1:] if expect_channel_axis and len(scale) > 1 else scale
-        if prev_scale is not None and any(curr < prev for curr, prev in zip(spatial_scale, prev_scale)):
-            _add_issue(
-                issues,
-                "NGFF_SCALE_NON_MONOTONIC",
-                "Scale factors must be monotonically increasing across pyramid levels.",
-                f"{group_path}/{path}",
-                Severity.ERROR,
+        shared = min(spatial_scale.size, prev_scale.size) if prev_scale is not None else 0
+        if shared and (spatial_scale[:shared] < prev_scale[:shared]).any():
+            issues.append(
+                (
+                    "NGFF_SCALE_NON_MONOTONIC",
+                    "Scale factors must be monotonically increasing across pyramid levels.",
+                    dataset_path,
+                    Severity.ERROR,
+                )
             )
         prev_scale = spatial_scale
-        reported_scale = scale
         if translation_transform is not None:
             translation = translation_transform.get("translation", [])
             if len(translation) != len(scale):
-                _add_issue(
-                    issues,
-                    "NGFF_TRANSLATION_DIMENSION_MISMATCH",
-                    "Translation vector length must match scale vector length.",
-                    f"{group_path}/{path}",
-                    Severity.ERROR,
+                issues.append(
+                    (
+                        "NGFF_TRANSLATION_DIMENSION_MISMATCH",
+                        "Translation vector length must match scale vector length.",
+                        dataset_path,
+                        Severity.ERROR,
+                    )
                 )
-    return reported_scale
+    return tuple(issues)
 
 
-def validate_ngff(path: Path) -> ValidationReport:
-    """Validate an NGFF Zarr bundle."""
+def _validate_multiscales(
+    group: zarr.hierarchy.Group,
+    group_path: str,
+    issues: List[_IssueTemplate],
+    expect_channel_axis: bool,
+) -> None:
+    multiscales = group.attrs.get("multiscales")
+    if not multiscales:
+        _add_issue(issues, "NGFF_METADATA_MISSING", "Missing multiscales metadata.", group_path, Severity.ERROR)
+        return
+    present_paths = tuple(
+        dataset.get("path") is not None and dataset.get("path") in group
+        for dataset in multiscales[0].get("datasets", [])
+    )
+    # Collections often share one multiscales template, so the pure metadata checks are memoised.
+    templates = _validate_multiscales_meta(
+        json.dumps(multiscales, sort_keys=True),
+        present_paths,
+        expect_channel_axis,
+    )
+    for code, message, suffix, severity in templates:
+        _add_issue(issues, code, message, f"{group_path}{suffix}", severity)
+
+
+def _scan_label_mask(mask_dataset: zarr.Array) -> Tuple[int, Optional[Tuple[int, int]]]:
+    """Stream a label mask chunk by chunk, returning the label count and the furthest labelled pixel."""
+    if mask_dataset.nchunks_initialized == 0:
+        return 0, None
+    height, width = mask_dataset.shape[-2:]
+    chunk_height, chunk_width = mask_dataset.chunks[-2:]
+    dtype = np.dtype(mask_dataset.dtype)
+    # uint8/uint16 masks (see _rasterize_labels) have a small fixed label range, so a histogram
+    # sized once is cheapest. Wider or signed ids could be huge or negative, so those masks
+    # collect per-chunk unique ids instead.
+    bounded = dtype.kind == "u" and dtype.itemsize <= 2
+    counts = np.zeros(2 ** (8 * dtype.itemsize), dtype=np.int64) if bounded else None
+    chunk_labels: List[np.ndarray] = []
+    rows_any = np.zeros(height, dtype=bool)
+    cols_any = np.zeros(width, dtype=bool)
+    for chunk_index in np.ndindex(*mask_dataset.cdata_shape):
+        chunk = mask_dataset.blocks[chunk_index]
+        if counts is not None:
+            counts += np.bincount(chunk.ravel(), minlength=counts.size)
+        else:
+            chunk_labels.append(np.unique(chunk))
+        foreground = (chunk > 0).reshape(-1, *chunk.shape[-2:]).any(axis=0)
+        row_start = chunk_index[-2] * chunk_height
+        col_start = chunk_index[-1] * chunk_width
+        rows_any[row_start : row_start + foreground.shape[0]] |= foreground.any(axis=1)
+        cols_any[col_start : col_start + foreground.shape[1]] |= foreground.any(axis=0)
+    if counts is not None:
+        label_count = int(np.count_nonzero(counts[1:]))
+    else:
+        labels = np.unique(np.concatenate(chunk_labels))
+        label_count = int(labels.size - np.count_nonzero(labels == 0))
+    if not rows_any.any():
+        return label_count, None
+    return label_count, (int(np.flatnonzero(rows_any)[-1]), int(np.flatnonzero(cols_any)[-1]))
+
+
+def _read_obs_index(table_group: zarr.hierarchy.Group) -> pd.Index:
+    """Read only the observation index of a Zarr-encoded AnnData table."""
     try:
-        root = zarr.open_group(str(path), mode="r")
-    except Exception as exc:  # pragma: no cover - IO failure path
-        raise ValidationIOError(str(exc)) from exc
+        obs_group = table_group["obs"]
+        index_key = obs_group.attrs.get("_index", "_index")
+        return pd.Index(obs_group[index_key][:])
+    except (KeyError, ValueError):
+        # Non-standard obs layout: fall back to materialising the full table from the open group.
+        return ad.experimental.read_elem(table_group).obs.index
+
+
+def _check_group(
+    check: Callable[[str, List[_IssueTemplate]], Any],
+    name: str,
+    fail_fast: bool,
+) -> Tuple[Any, List[_IssueTemplate]]:
+    """Run a per-group check against a private issue buffer so groups can be checked concurrently."""
+    local = _IssueList(fail_fast=fail_fast)
+    try:
+        return check(name, local), local
+    except _FailFast:
+        return None, local
 
-    issues: List[ValidationIssue] = []
-    summary: Dict[str, Any] = {"target": str(path), "format": "ngff"}
 
+def _map_groups(
+    check: Callable[[str, List[_IssueTemplate]], Any],
+    names: List[str],
+    issues: List[_IssueTemplate],
+    parallel: bool,
+) -> Iterable[Tuple[Any, List[_IssueTemplate]]]:
+    fail_fast = getattr(issues, "fail_fast", False)
+    if parallel and len(names) > 1:
+        # Group checks are dominated by Zarr attribute and chunk reads, so threads overlap the I/O.
+        with ThreadPoolExecutor(max_workers=min(_MAX_VALIDATION_WORKERS, len(names))) as executor:
+            return list(executor.map(lambda name: _check_group(check, name, fail_fast), names))
+    # Lazily evaluated so sequential fail-fast runs skip the remaining groups.
+    return (_check_group(check, name, fail_fast) for name in names)
+
+
+def _merge_issues(issues: List[_IssueTemplate], local: List[_IssueTemplate]) -> None:
+    for issue in local:
+        _add_issue(issues, *issue)
+
+
+def _validate_one_image(
+    group: zarr.hierarchy.Group,
+    group_path: str,
+    issues: List[_IssueTemplate],
+) -> Optional[Tuple[int, int]]:
+    shape: Optional[Tuple[int, int]] = None
+    dataset = group.get("0")
+    if dataset is None:
+        _add_issue(issues, "NGFF_DATASET_MISSING", "Level '0' not found for image.", group_path, Severity.ERROR)
+    elif dataset.ndim >= 2:
+        shape = tuple(dataset.shape[-2:])
+    _validate_multiscales(group, group_path, issues, expect_channel_axis=True)
+    return shape
+
+
+def _validate_one_label(
+    group: zarr.hierarchy.Group,
+    group_path: str,
+    expected_shape: Optional[Tuple[int, int]],
+    issues: List[_IssueTemplate],
+) -> Optional[int]:
+    if "image-label" not in group.attrs:
+        _add_issue(
+            issues,
+            "NGFF_LABEL_METADATA_MISSING",
+            "Label group missing image-label metadata.",
+            group_path,
+            Severity.ERROR,
+        )
+    mask_dataset = group.get("0")
+    if mask_dataset is None:
+        _add_issue(issues, "NGFF_DATASET_MISSING", "Level '0' not found for label.", group_path, Severity.ERROR)
+        return None
+    # Cheap metadata checks first so fail-fast runs can stop before scanning the mask.
+    _validate_multiscales(group, group_path, issues, expect_channel_axis=False)
+    mask_shape = tuple(mask_dataset.shape[-2:])
+    if expected_shape is not None and mask_shape != expected_shape:
+        _add_issue(
+            issues,
+            "NGFF_LABEL_SHAPE_MISMATCH",
+            "Label mask shape does not match image shape.",
+            group_path,
+            Severity.ERROR,
+        )
+    label_count, max_coords = _scan_label_mask(mask_dataset)
+    if expected_shape is not None and max_coords is not None:
+        max_y, max_x = max_coords
+        if max_y >= expected_shape[0] or max_x >= expected_shape[1]:
+            _add_issue(
+                issues,
+                "NGFF_LABEL_BOUNDARY",
+                "Label geometry extends beyond image bounds.",
+                group_path,
+                Severity.ERROR,
+            )
+    return label_count
+
+
+def _validate_one_table(
+    group: zarr.hierarchy.Group,
+    group_path: str,
+    issues: List[_IssueTemplate],
+) -> Optional[int]:
+    try:
+        obs_index = _read_obs_index(group)
+    except Exception as exc:
+        _add_issue(
+            issues,
+            "NGFF_TABLE_READ_ERROR",
+            f"Failed to read AnnData table: {exc}.",
+            group_path,
+            Severity.ERROR,
+        )
+        return None
+    if obs_index.has_duplicates:
+        _add_issue(
+            issues,
+            "NGFF_TABLE_DUPLICATE_INDEX",
+            "AnnData observation index contains duplicates.",
+            group_path,
+            Severity.ERROR,
+        )
+    return len(obs_index)
+
+
+def _collect_ngff_issues(
+    root: zarr.hierarchy.Group,
+    issues: List[_IssueTemplate],
+    summary: Dict[str, Any],
+    parallel: bool = True,
+) -> None:
     provenance_attr = root.attrs.get("omnispatial_provenance")
     if provenance_attr is None:
         _add_issue(
@@ -172,144 +380,114 @@ def validate_ngff(path: Path) -> ValidationReport:
     images = root.get("images")
     if images is None:
         _add_issue(issues, "NGFF_IMAGES_MISSING", "Images group not found.", "/images", Severity.ERROR)
-        image_groups = {}
+        image_names: List[str] = []
     else:
-        image_groups = {name: images[name] for name in images.group_keys()}
-    summary["images"] = len(image_groups)
+        image_names = list(images.group_keys())
+    summary["images"] = len(image_names)
 
     image_shapes: Dict[str, Tuple[int, int]] = {}
-    image_scales: Dict[str, List[float]] = {}
-
-    for name, group in image_groups.items():
-        dataset = group.get("0")
-        if dataset is None:
-            _add_issue(issues, "NGFF_DATASET_MISSING", "Level '0' not found for image.", f"/images/{name}", Severity.ERROR)
-        else:
-            data = dataset[:]
-            if data.ndim >= 2:
-                image_shapes[name] = data.shape[-2:]
-        scales = _validate_multiscales(group, f"/images/{name}", issues, expect_channel_axis=True)
-        image_scales[name] = scales
+    image_results = _map_groups(
+        lambda name, local: _validate_one_image(images[name], f"/images/{name}", local),
+        image_names,
+        issues,
+        parallel,
+    )
+    for name, (shape, local) in zip(image_names, image_results):
+        _merge_issues(issues, local)
+        if shape is not None:
+            image_shapes[name] = shape
 
     labels = root.get("labels")
-    if labels is None:
-        label_groups: Dict[str, zarr.hierarchy.Group] = {}
-    else:
-        label_groups = {name: labels[name] for name in labels.group_keys()}
-    summary["labels"] = len(label_groups)
-
-    label_counts: List[int] = []
-    for name, group in label_groups.items():
-        attrs = group.attrs
-        if "image-label" not in attrs:
-            _add_issue(
-                issues,
-                "NGFF_LABEL_METADATA_MISSING",
-                "Label group missing image-label metadata.",
-                f"/labels/{name}",
-                Severity.ERROR,
-            )
-        mask_dataset = group.get("0")
-        if mask_dataset is None:
-            _add_issue(issues, "NGFF_DATASET_MISSING", "Level '0' not found for label.", f"/labels/{name}", Severity.ERROR)
-            continue
-        mask = mask_dataset[:]
-        mask_shape = mask.shape[-2:]
-        label_counts.append(int(len(np.unique(mask)) - (1 if 0 in mask else 0)))
-        linked_image_name = next(iter(image_shapes), None)
-        if linked_image_name:
-            expected_shape = image_shapes[linked_image_name]
-            if mask_shape != expected_shape:
-                _add_issue(
-                    issues,
-                    "NGFF_LABEL_SHAPE_MISMATCH",
-                    "Label mask shape does not match image shape.",
-                    f"/labels/{name}",
-                    Severity.ERROR,
-                )
-            coords = np.argwhere(mask > 0)
-            if coords.size:
-                max_y, max_x = coords.max(axis=0)
-                if max_y >= expected_shape[0] or max_x >= expected_shape[1]:
-                    _add_issue(
-                        issues,
-                        "NGFF_LABEL_BOUNDARY",
-                        "Label geometry extends beyond image bounds.",
-                        f"/labels/{name}",
-                        Severity.ERROR,
-                    )
-        _validate_multiscales(group, f"/labels/{name}", issues, expect_channel_axis=False)
+    label_names = list(labels.group_keys()) if labels is not None else []
+    summary["labels"] = len(label_names)
+
+    linked_image_name = next(iter(image_shapes), None)
+    expected_shape = image_shapes[linked_image_name] if linked_image_name else None
+    # Running totals; None until at least one label/table has been counted.
+    label_total: Optional[int] = None
+    label_results = _map_groups(
+        lambda name, local: _validate_one_label(labels[name], f"/labels/{name}", expected_shape, local),
+        label_names,
+        issues,
+        parallel,
+    )
+    for label_count, local in label_results:
+        _merge_issues(issues, local)
+        if label_count is not None:
+            label_total = (label_total or 0) + label_count
 
     tables = root.get("tables")
-    if tables is None:
-        table_groups: Dict[str, zarr.hierarchy.Group] = {}
-    else:
-        table_groups = {name: tables[name] for name in tables.group_keys()}
-    summary["tables"] = len(table_groups)
-
-    table_counts: List[int] = []
-    for name in table_groups:
-        adata_path = path / "tables" / name
-        try:
-            adata = ad.read_zarr(str(adata_path))
-        except Exception as exc:
-            _add_issue(
-                issues,
-                "NGFF_TABLE_READ_ERROR",
-                f"Failed to read AnnData table: {exc}.",
-                f"/tables/{name}",
-                Severity.ERROR,
-            )
-            continue
-        table_counts.append(int(adata.n_obs))
-        if adata.obs.index.has_duplicates:
-            _add_issue(
-                issues,
-                "NGFF_TABLE_DUPLICATE_INDEX",
-                "AnnData observation index contains duplicates.",
-                f"/tables/{name}",
-                Severity.ERROR,
-            )
+    table_names = list(tables.group_keys()) if tables is not None else []
+    summary["tables"] = len(table_names)
+
+    table_total: Optional[int] = None
+    table_results = _map_groups(
+        lambda name, local: _validate_one_table(tables[name], f"/tables/{name}", local),
+        table_names,
+        issues,
+        parallel,
+    )
+    for table_count, local in table_results:
+        _merge_issues(issues, local)
+        if table_count is not None:
+            table_total = (table_total or 0) + table_count
+
+    if label_total is not None and table_total is not None and label_total != table_total:
+        _add_issue(
+            issues,
+            "NGFF_TABLE_LABEL_MISMATCH",
+            "Sum of label indices does not match table observations.",
+            "/tables",
+            Severity.ERROR,
+        )
 
-    if label_counts and table_counts:
-        if sum(label_counts) != sum(table_counts):
-            _add_issue(
-                issues,
-                "NGFF_TABLE_LABEL_MISMATCH",
-                "Sum of label indices does not match table observations.",
-                "/tables",
-                Severity.ERROR,
-            )
 
-    # Coordinate transform invertibility check.
-    for name, scales in image_scales.items():
-        if scales and any(value <= 0 for value in scales):
-            _add_issue(
-                issues,
-                "NGFF_TRANSFORM_NON_INVERTIBLE",
-                "Image scale contains non-positive values, making transform non-invertible.",
-                f"/images/{name}",
-                Severity.ERROR,
-            )
+def validate_ngff(path: Path, *, fail_fast: bool = False, parallel: bool = True) -> ValidationReport:
+    """Validate an NGFF Zarr bundle, optionally stopping at the first error.
 
-    ok = not any(issue.severity == Severity.ERROR for issue in issues)
-    return ValidationReport(ok=ok, issues=issues, summary=summary)
+    Images, labels and tables are checked on a thread pool unless ``parallel`` is false.
+    """
+    try:
+        root = zarr.open_group(str(path), mode="r")
+    except Exception as exc:  # pragma: no cover - IO failure path
+        raise ValidationIOError(str(exc)) from exc
+
+    issues = _IssueList(fail_fast=fail_fast)
+    summary: Dict[str, Any] = {"target": str(path), "format": "ngff"}
+    try:
+        _collect_ngff_issues(root, issues, summary, parallel=parallel)
+    except _FailFast:
+        summary["fail_fast"] = True
 
+    ok = not any(severity is Severity.ERROR for *_, severity in issues)
+    # Buffered fields are always well-typed internally, so skip pydantic field validation.
+    report_issues = [
+        ValidationIssue.model_construct(code=code, message=message, path=issue_path, severity=severity)
+        for code, message, issue_path, severity in issues
+    ]
+    return ValidationReport(ok=ok, issues=report_issues, summary=summary)
 
-def validate_spatialdata(path: Path) -> ValidationReport:
+
+def validate_spatialdata(path: Path, *, fail_fast: bool = False, parallel: bool = True) -> ValidationReport:
     """Validate a SpatialData Zarr bundle."""
-    report = validate_ngff(path)
+    report = validate_ngff(path, fail_fast=fail_fast, parallel=parallel)
     report.summary["format"] = "spatialdata"
     return report
 
 
-def validate_bundle(path: Path, fmt: str) -> ValidationReport:
+_FORMAT_DISPATCH: Dict[str, Callable[..., ValidationReport]] = {
+    "ngff": validate_ngff,
+    "spatialdata": validate_spatialdata,
+}
+
+
+def validate_bundle(path: Path, fmt: str, *, fail_fast: bool = False, parallel: bool = True) -> ValidationReport:
     """Dispatch validation based on bundle format."""
-    if fmt.lower() == "ngff":
-        return validate_ngff(path)
-    if fmt.lower() == "spatialdata":
-        return validate_spatialdata(path)
-    raise ValueError(f"Unsupported format '{fmt}'.")
+    try:
+        validator = _FORMAT_DISPATCH[fmt.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported format '{fmt}'.") from None
+    return validator(path, fail_fast=fail_fast, parallel=parallel)
 
 
 __all__ = [
@@ -38,13 +38,12 @@ def _create_xenium_fixture(root: Path) -> None:
     matrix.to_csv(root / "matrix.csv", index=False)
 
 
-def _expected_sources(dataset_dir: Path) -> set[str]:
-    return {
-        str((dataset_dir / "cells.csv").resolve()),
-        str((dataset_dir / "matrix.csv").resolve()),
-        str((dataset_dir / "images" / "synthetic.tif").resolve()),
-        str((dataset_dir / "matrix.h5ad").resolve()),
-    }
+def _expected_sources(dataset_dir: Path) -> frozenset[str]:
+    base = dataset_dir.resolve()
+    return frozenset(
+        str(base / relative)
+        for relative in ("cells.csv", "matrix.csv", "images/synthetic.tif", "matrix.h5ad")
+    )
 
 
 def test_api_convert_and_validate(tmp_path: Path) -> None:
@@ -0,0 +1,24 @@
+"""Unit tests for the tabular IO helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from omnispatial.utils import load_tabular_file, tabular_columns
+
+
+def test_load_tabular_file_matches_read_csv(tmp_path: Path) -> None:
+    path = tmp_path / "table.csv"
+    path.write_text("id,flag,label,when\n1,True,NA,2024-01-01\n2,,null,\n3,false,cell,2024-01-03\n")
+    pd.testing.assert_frame_equal(load_tabular_file(path), pd.read_csv(path))
+
+
+def test_load_tabular_file_mangles_duplicate_headers(tmp_path: Path) -> None:
+    path = tmp_path / "duplicates.csv"
+    path.write_text("a,a,a.1,b,a\n1,2,3,4,5\n")
+    expected = pd.read_csv(path)
+    assert tabular_columns(path) == ["a", "a.2", "a.1", "b", "a.3"] == list(expected.columns)
+    pd.testing.assert_frame_equal(load_tabular_file(path), expected)
+    pd.testing.assert_frame_equal(load_tabular_file(path, columns=["a.3", "a"]), expected[["a.3", "a"]])
@@ -8,7 +8,8 @@ import numpy as np
 import pandas as pd
 import pytest
 from hypothesis import given, strategies as st
-from shapely.geometry import box
+from pydantic import ValidationError
+from shapely.geometry import Polygon, box
 from shapely.geometry.base import BaseGeometry
 
 from omnispatial.core.model import (
@@ -136,6 +137,41 @@ def test_polygon_roundtrip(data: Tuple[SpatialDataset, BaseGeometry, int]) -> No
     assert dataset.tables[0].cell_count == rows
 
 
+def test_label_layer_len_and_validity() -> None:
+    transform = AffineTransform(matrix=IDENTITY, units="micrometer", source="local", target="global")
+    bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+    for geometry_format in ("wkt", "wkb"):
+        layer = LabelLayer(
+            name="labels",
+            frame="local",
+            crs="micrometer",
+            geometry_format=geometry_format,
+            geometries=[box(0, 0, 1, 1), box(1, 1, 2, 2)],
+            transform=transform,
+        )
+        assert len(layer) == 2
+        assert layer.all_valid()
+        layer.geometries = [*layer.iter_geometries(), bowtie]
+        assert len(layer) == 3
+        assert not layer.all_valid()
+
+
+def test_label_layer_wkb_json_round_trip() -> None:
+    transform = AffineTransform(matrix=IDENTITY, units="micrometer", source="local", target="global")
+    layer = LabelLayer(
+        name="labels",
+        frame="local",
+        crs="micrometer",
+        geometry_format="wkb",
+        geometries=[box(0, 0, 1, 1)],
+        transform=transform,
+    )
+    restored = LabelLayer.model_validate_json(layer.model_dump_json())
+    assert restored.geometries == layer.geometries
+    with pytest.raises(ValidationError):
+        layer.geometry_format = "wkt"
+
+
 def test_spatial_dataset_requires_provenance() -> None:
     global_frame = CoordinateFrame(
         name="global",
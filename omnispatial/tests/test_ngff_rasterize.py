@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import numpy as np
 import pytest
+import shapely
 from shapely.geometry import Polygon
 
 from omnispatial.ngff.writer import _rasterize_labels
@@ -12,7 +13,7 @@ from omnispatial.ngff.writer import _rasterize_labels
 def test_rasterize_single_polygon() -> None:
     polygon = "POLYGON ((1 1, 4 1, 4 4, 1 4, 1 1))"
     mask = _rasterize_labels([polygon], (6, 6))
-    expected = np.zeros((6, 6), dtype=np.uint32)
+    expected = np.zeros((6, 6), dtype=np.uint8)
     expected[1:4, 1:4] = 1
     np.testing.assert_array_equal(mask, expected)
 
@@ -23,12 +24,31 @@ def test_rasterize_multi_polygon_assigns_unique_labels() -> None:
         "MULTIPOLYGON (((3 0, 5 0, 5 2, 3 2, 3 0)))",
     ]
     mask = _rasterize_labels(geometries, (4, 6))
-    assert mask.dtype == np.uint32
-    assert set(np.unique(mask)) == {0, 1, 2}
+    assert mask.dtype == np.uint8
+    assert np.array_equal(np.unique(mask), np.array([0, 1, 2], dtype=mask.dtype))
     assert mask[1, 1] == 1
     assert mask[1, 4] == 2
 
 
+def test_rasterize_wkb_matches_wkt() -> None:
+    geometries = [
+        "POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))",
+        "MULTIPOLYGON (((3 0, 5 0, 5 2, 3 2, 3 0)))",
+    ]
+    encoded = [shapely.to_wkb(shapely.from_wkt(geometry)) for geometry in geometries]
+    np.testing.assert_array_equal(
+        _rasterize_labels(encoded, (4, 6), "wkb"),
+        _rasterize_labels(geometries, (4, 6)),
+    )
+
+
+def test_rasterize_widens_dtype_for_many_labels() -> None:
+    geometries = [f"POLYGON (({i} 0, {i + 1} 0, {i + 1} 1, {i} 1, {i} 0))" for i in range(300)]
+    mask = _rasterize_labels(geometries, (1, 300))
+    assert mask.dtype == np.uint16
+    assert mask[0, 299] == 300
+
+
 def test_rasterize_rejects_non_polygon_geometry() -> None:
     with pytest.raises(TypeError):
         _rasterize_labels(["POINT (1 1)"], (2, 2))
@@ -41,3 +61,13 @@ def test_rasterize_rejects_empty_geometry() -> None:
     assert empty_polygon.is_empty
     with pytest.raises(ValueError):
         _rasterize_labels([empty_polygon.wkt], (4, 4))
+
+
+def test_rasterize_skips_geometries_outside_raster() -> None:
+    geometries = [
+        "POLYGON ((10 10, 12 10, 12 12, 10 12, 10 10))",
+        "POLYGON ((0 0, 2 0, 2 2, 0 2, 0 0))",
+    ]
+    mask = _rasterize_labels(geometries, (4, 4))
+    assert np.array_equal(np.unique(mask), np.array([0, 2], dtype=mask.dtype))
+    assert mask[1, 1] == 2
@@ -17,6 +17,7 @@ from omnispatial.core.model import (
     SpatialDataset,
 )
 from omnispatial.ngff import write_ngff
+from omnispatial.utils import read_image_lazy
 
 IDENTITY = (
     (1.0, 0.0, 0.0),
@@ -99,3 +100,32 @@ def test_write_ngff_streams_zarr(tmp_path: Path) -> None:
     out_root = zarr.open_group(str(result_path), mode="r")
     written = out_root["images"]["test_image"]["0"][:]
     np.testing.assert_array_equal(written, data)
+
+
+def test_read_image_lazy_defers_tiff_decode(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = (np.arange(512 * 512, dtype=np.uint16) % 256).reshape(512, 512)
+    image_path = tmp_path / "lazy.tif"
+    tifffile.imwrite(image_path, data)
+
+    def _raise(*args, **kwargs):
+        raise RuntimeError("tifffile.imread should not be called for lazy reads.")
+
+    monkeypatch.setattr("omnispatial.utils.io.tifffile.imread", _raise)
+
+    lazy = read_image_lazy(image_path, chunks=(128, 128))
+    assert lazy.chunksize == (128, 128)
+    np.testing.assert_array_equal(lazy.compute(), data)
+
+
+def test_write_ngff_skips_empty_chunks(tmp_path: Path) -> None:
+    data = np.zeros((256, 256), dtype=np.uint16)
+    data[:64, :64] = 7
+    image_path = tmp_path / "sparse.tif"
+    tifffile.imwrite(image_path, data)
+
+    dataset = _dataset_with_image(image_path)
+    result_path = Path(write_ngff(dataset, str(tmp_path / "sparse.zarr"), image_chunks=(1, 64, 64)))
+
+    written = zarr.open_group(str(result_path), mode="r")["images"]["test_image"]["0"]
+    assert written.nchunks_initialized == 1
+    np.testing.assert_array_equal(written[0], data)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
 
 import anndata as ad
+import numpy as np
 import pandas as pd
-from shapely import wkt
-from shapely.affinity import translate
+import shapely
+from scipy import sparse
 
 from omnispatial.adapters.base import SpatialAdapter
 from omnispatial.core.model import (
@@ -19,7 +21,13 @@ from omnispatial.core.model import (
     SpatialDataset,
     TableLayer,
 )
-from omnispatial.utils import dataframe_summary, load_tabular_file, read_image_any, temporary_output_path
+from omnispatial.utils import (
+    dataframe_summary,
+    load_tabular_file,
+    probe_image_shape,
+    tabular_columns,
+    temporary_output_path,
+)
 
 PIXEL_UNITS = "micrometer"
 PIXEL_SIZE = 0.75
@@ -38,8 +46,37 @@ _IMAGE_CANDIDATES = (
 )
 
 
+_COLUMN_SEPARATORS = str.maketrans({" ": "_", ".": "_"})
+
+
 def _normalise_column(name: str) -> str:
-    return name.lower().replace(" ", "_").replace(".", "_")
+    return name.lower().translate(_COLUMN_SEPARATORS)
+
+
+def _scan_base(base: Path) -> Dict[str, FrozenSet[str]]:
+    """List every lookup directory under ``base`` once, for all resolvers to share."""
+    listing: Dict[str, FrozenSet[str]] = {}
+    for directory in dict.fromkeys((*_LOOKUP_DIRS, *_IMAGE_DIRS)):
+        try:
+            with os.scandir(base / directory) as entries:
+                listing[directory] = frozenset(entry.name for entry in entries)
+        except OSError:
+            listing[directory] = frozenset()
+    return listing
+
+
+def _find_candidate(
+    base: Path,
+    listing: Dict[str, FrozenSet[str]],
+    directories: Iterable[str],
+    candidates: Iterable[str],
+) -> Optional[Path]:
+    for directory in directories:
+        names = listing[directory]
+        for candidate in candidates:
+            if candidate in names:
+                return (base / directory / candidate).resolve()
+    return None
 
 
 def _resolve_column(columns: Dict[str, str], candidates: Iterable[str]) -> str:
@@ -54,6 +91,8 @@ class CosMxPublicAdapter(SpatialAdapter):
     """Adapter for NanoString CosMx public release CSV datasets."""
 
     name = "cosmx-public"
+    # h5py filter for the intermediate AnnData table; set to "gzip" for smaller archival files.
+    table_compression: Optional[str] = "lzf"
 
     def metadata(self) -> Dict[str, Any]:
         return {
@@ -65,26 +104,31 @@ class CosMxPublicAdapter(SpatialAdapter):
 
     def detect(self, input_path: Path) -> bool:
         base = Path(input_path)
+        if not base.exists():
+            return False
+        listing = _scan_base(base)
+        # Stitched composite images are the most CosMx-specific resource, so check them first and
+        # let non-CosMx inputs fail before the generic cells/expression table lookups.
         return (
-            base.exists()
-            and self._resolve_cells(base) is not None
-            and self._resolve_expression(base) is not None
-            and self._resolve_image(base) is not None
+            self._resolve_image(base, listing) is not None
+            and self._resolve_cells(base, listing) is not None
+            and self._resolve_expression(base, listing) is not None
         )
 
     def read(self, input_path: Path) -> SpatialDataset:
         base = Path(input_path)
-        cells_path = self._resolve_cells(base)
-        expr_path = self._resolve_expression(base)
-        image_path = self._resolve_image(base)
+        listing = _scan_base(base)
+        cells_path = self._resolve_cells(base, listing)
+        expr_path = self._resolve_expression(base, listing)
+        image_path = self._resolve_image(base, listing)
 
         if cells_path is None or expr_path is None or image_path is None:
             raise FileNotFoundError("CosMx public release dataset is missing cells, expression, or image resources.")
 
         cells = self._load_cells(cells_path)
         expr = self._load_expression(expr_path)
-        image_data, _ = read_image_any(image_path)
-        width = int(image_data.shape[-1])
+        # Only the width is needed for region tiling; pixels are read later by the NGFF writer.
+        width = int(probe_image_shape(image_path)[-1])
 
         region_offsets = self._compute_region_offsets(cells, width)
         stitched_cells = self._apply_offsets(cells, region_offsets)
@@ -137,65 +181,55 @@ class CosMxPublicAdapter(SpatialAdapter):
             provenance=provenance,
         )
 
-    def _resolve_cells(self, base: Path) -> Optional[Path]:
-        for directory in _LOOKUP_DIRS:
-            for candidate in _CELL_CANDIDATES:
-                candidate_path = (base / directory / candidate).resolve()
-                if candidate_path.exists():
-                    return candidate_path
-        return None
-
-    def _resolve_expression(self, base: Path) -> Optional[Path]:
-        for directory in _LOOKUP_DIRS:
-            for candidate in _EXPR_CANDIDATES:
-                candidate_path = (base / directory / candidate).resolve()
-                if candidate_path.exists():
-                    return candidate_path
-        return None
-
-    def _resolve_image(self, base: Path) -> Optional[Path]:
-        for directory in _IMAGE_DIRS:
-            for candidate in _IMAGE_CANDIDATES:
-                candidate_path = (base / directory / candidate).resolve()
-                if candidate_path.exists():
-                    return candidate_path
-        return None
+    def _resolve_cells(self, base: Path, listing: Dict[str, FrozenSet[str]]) -> Optional[Path]:
+        return _find_candidate(base, listing, _LOOKUP_DIRS, _CELL_CANDIDATES)
+
+    def _resolve_expression(self, base: Path, listing: Dict[str, FrozenSet[str]]) -> Optional[Path]:
+        return _find_candidate(base, listing, _LOOKUP_DIRS, _EXPR_CANDIDATES)
+
+    def _resolve_image(self, base: Path, listing: Dict[str, FrozenSet[str]]) -> Optional[Path]:
+        return _find_candidate(base, listing, _IMAGE_DIRS, _IMAGE_CANDIDATES)
 
     def _load_cells(self, path: Path) -> pd.DataFrame:
-        df = load_tabular_file(path)
-        normalised = {_normalise_column(col): col for col in df.columns}
+        normalised = {_normalise_column(col): col for col in tabular_columns(path)}
         cell_col = _resolve_column(normalised, ("cell_id", "cellid", "cell", "id"))
         x_col = _resolve_column(normalised, ("centroid_x", "center_x", "x_centroid", "centerx", "x"))
         y_col = _resolve_column(normalised, ("centroid_y", "center_y", "y_centroid", "centery", "y"))
         region_col = _resolve_column(normalised, ("region", "fov", "tile", "roi"))
         polygon_col = _resolve_column(normalised, ("polygon_wkt", "geometry", "geom", "outline_wkt"))
 
-        selected = df[[normalised[cell_col], normalised[x_col], normalised[y_col], normalised[region_col], normalised[polygon_col]]].copy()
+        wanted = [normalised[cell_col], normalised[x_col], normalised[y_col], normalised[region_col], normalised[polygon_col]]
+        # Only decode the five columns the adapter keeps.
+        df = load_tabular_file(path, columns=list(dict.fromkeys(wanted)))
+        selected = df[wanted].copy()
         selected.columns = ["cell_id", "centroid_x", "centroid_y", "region", "polygon_wkt"]
         if selected["polygon_wkt"].isna().any():
             raise ValueError("Polygon annotations contain null entries.")
         return selected.set_index("cell_id", drop=False)
 
     def _load_expression(self, path: Path) -> pd.DataFrame:
-        df = load_tabular_file(path)
-        normalised = {_normalise_column(col): col for col in df.columns}
+        normalised = {_normalise_column(col): col for col in tabular_columns(path)}
         required = {"cell_id", "target", "count"}
         if required.issubset(normalised):
-            tidy = df[[normalised["cell_id"], normalised["target"], normalised["count"]]].copy()
+            wanted = [normalised["cell_id"], normalised["target"], normalised["count"]]
+            tidy = load_tabular_file(path, columns=wanted)[wanted].copy()
             tidy.columns = ["cell_id", "target", "count"]
             return tidy
 
+        df = load_tabular_file(path)
         cell_candidate = _resolve_column(normalised, ("cell_id", "cellid", "cell", "id"))
         wide = df.set_index(normalised[cell_candidate])
-        wide.index.name = "cell_id"
-        melted = (
-            wide.reset_index()
-            .melt(id_vars="cell_id", var_name="target", value_name="count")
-            .dropna(subset=["count"])
+        counts = wide.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        # Pick out the positive entries directly instead of melting every (cell, target) pair first;
+        # scanning the transpose keeps melt's target-major row order.
+        target_index, cell_index = np.nonzero(counts.T > 0)
+        return pd.DataFrame(
+            {
+                "cell_id": wide.index.to_numpy()[cell_index],
+                "target": wide.columns.to_numpy()[target_index],
+                "count": counts[cell_index, target_index],
+            }
         )
-        melted["count"] = pd.to_numeric(melted["count"], errors="coerce").fillna(0).astype(float)
-        melted = melted[melted["count"] > 0]
-        return melted
 
     @staticmethod
     def _affine_scale(scale: float) -> Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]]:
@@ -206,21 +240,23 @@ class CosMxPublicAdapter(SpatialAdapter):
         )
 
     @staticmethod
-    def _compute_region_offsets(cells: pd.DataFrame, width: int) -> Dict[str, float]:
-        regions = sorted(cells["region"].astype(str).unique())
-        return {region: index * float(width) for index, region in enumerate(regions)}
+    def _compute_region_offsets(cells: pd.DataFrame, width: int) -> np.ndarray:
+        """Return each cell's x offset, tiling regions side by side in sorted order."""
+        regions = pd.Categorical(cells["region"].astype(str))
+        offsets = np.arange(len(regions.categories), dtype=np.float64) * float(width)
+        return offsets[regions.codes]
 
     @staticmethod
-    def _apply_offsets(cells: pd.DataFrame, offsets: Dict[str, float]) -> pd.DataFrame:
+    def _apply_offsets(cells: pd.DataFrame, xoff: np.ndarray) -> pd.DataFrame:
         adjusted = cells.copy()
-        adjusted["x"] = cells["centroid_x"] + cells["region"].map(offsets)
+        adjusted["x"] = cells["centroid_x"].to_numpy(dtype=float) + xoff
         adjusted["y"] = cells["centroid_y"]
-        polygons: List[str] = []
-        for region, wkt_string in zip(cells["region"], cells["polygon_wkt"]):
-            polygon = wkt.loads(wkt_string)
-            polygon = translate(polygon, xoff=offsets[str(region)], yoff=0.0)
-            polygons.append(polygon.wkt)
-        adjusted["polygon_wkt"] = polygons
+        geometries = shapely.from_wkt(cells["polygon_wkt"].to_numpy(dtype=object))
+        # Shift every vertex of the column in one pass rather than translating polygons one by one.
+        coords, owners = shapely.get_coordinates(geometries, return_index=True)
+        coords[:, 0] += xoff[owners]
+        geometries = shapely.set_coordinates(geometries, coords)
+        adjusted["polygon_wkt"] = shapely.to_wkt(geometries, rounding_precision=-1).tolist()
         return adjusted
 
     def _build_label_layer(
@@ -248,16 +284,25 @@ class CosMxPublicAdapter(SpatialAdapter):
         transform: AffineTransform,
         local_frame: CoordinateFrame,
     ) -> TableLayer:
-        pivot = (
-            expr.pivot_table(index="cell_id", columns="target", values="count", aggfunc="sum", fill_value=0)
-            .sort_index()
+        # Expression is long-form and mostly zero, so assemble a sparse cell x gene matrix from category codes.
+        cell_codes = pd.Categorical(expr["cell_id"])
+        gene_codes = pd.Categorical(expr["target"])
+        # Missing or non-numeric counts contribute nothing to their cell/gene sum, as pivot_table's did.
+        counts = pd.to_numeric(expr["count"], errors="coerce").to_numpy(dtype=np.float32)
+        present = (cell_codes.codes >= 0) & (gene_codes.codes >= 0) & np.isfinite(counts) & (counts != 0)
+        matrix = sparse.csr_matrix(
+            (
+                counts[present],
+                (cell_codes.codes[present], gene_codes.codes[present]),
+            ),
+            shape=(len(cell_codes.categories), len(gene_codes.categories)),
         )
-        pivot = pivot.sort_index(axis=1)
-        obs = cells.loc[pivot.index]
-        var = pd.DataFrame(index=pivot.columns)
-        adata = ad.AnnData(X=pivot.astype(float).values, obs=obs.copy(), var=var)
+        matrix.sum_duplicates()
+        obs = cells.loc[cell_codes.categories]
+        var = pd.DataFrame(index=gene_codes.categories)
+        adata = ad.AnnData(X=matrix, obs=obs.copy(), var=var)
         adata_path = temporary_output_path(stem="cosmx-public-expr", suffix=".h5ad")
-        adata.write(adata_path, compression="gzip")
+        adata.write(adata_path, compression=self.table_compression)
         summary = dataframe_summary(obs.reset_index(drop=True))
         summary.update({"var_count": int(adata.n_vars), "adata_path": str(adata_path)})
         return TableLayer(
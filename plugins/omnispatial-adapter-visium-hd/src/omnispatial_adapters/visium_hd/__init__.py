@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 import anndata as ad
+import numpy as np
 import pandas as pd
-from shapely.geometry import Point
+import shapely
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
 
 from omnispatial.adapters.base import SpatialAdapter
 from omnispatial.core.model import (
@@ -19,7 +28,7 @@ from omnispatial.core.model import (
     SpatialDataset,
     TableLayer,
 )
-from omnispatial.utils import dataframe_summary, load_tabular_file, temporary_output_path
+from omnispatial.utils import dataframe_summary, load_tabular_file, tabular_columns, temporary_output_path
 
 OUTS_DIR_CANDIDATES = ("outs", ".", "output")
 MATRIX_FILES = ("filtered_feature_bc_matrix.h5",)
@@ -28,16 +37,32 @@ SPATIAL_DIR = "spatial"
 POSITIONS_FILES = ("tissue_positions.parquet", "tissue_positions.csv")
 SCALEFACTORS_FILE = "scalefactors_json.json"
 HIGHRES_IMAGE = "tissue_hires_image.png"
+# Below this many spots the thread pool costs more than it saves.
+_PARALLEL_OUTLINE_MIN_SPOTS = 10_000
 
 
 def _normalise_column(name: str) -> str:
     return name.lower().replace(" ", "_")
 
 
+def _spot_outlines(x: np.ndarray, y: np.ndarray, radius: float) -> np.ndarray:
+    outlines = shapely.simplify(shapely.buffer(shapely.points(x, y), radius), 0.5)
+    return shapely.to_wkb(outlines)
+
+
+@lru_cache(maxsize=32)
+def _parse_scalefactors(scale_path: Path, mtime_ns: int) -> Dict[str, float]:
+    raw = scale_path.read_bytes()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return {key: float(value) for key, value in data.items()}
+
+
 class VisiumHDAdapter(SpatialAdapter):
     """Adapter for 10x Genomics Visium HD (Space Ranger) outputs."""
 
     name = "visium_hd"
+    # h5py filter for the intermediate AnnData table; set to "gzip" for smaller archival files.
+    table_compression: Optional[str] = "lzf"
 
     def metadata(self) -> Dict[str, Any]:
         return {
@@ -71,7 +96,10 @@ class VisiumHDAdapter(SpatialAdapter):
 
         positions = self._load_positions(spatial_dir)
         positions = positions.set_index("barcode")
-        adata = adata[adata.obs_names.isin(positions.index)].copy()
+        keep = adata.obs_names.isin(positions.index)
+        # Space Ranger usually lists every barcode in the positions file; only pay for a subset copy when it does not.
+        if not keep.all():
+            adata = adata[keep].copy()
         adata.obs = positions.loc[adata.obs_names]
 
         scalefactors = self._load_scalefactors(spatial_dir)
@@ -118,9 +146,10 @@ class VisiumHDAdapter(SpatialAdapter):
 
     def _resolve_outs_dir(self, base: Path) -> Optional[Path]:
         for candidate in OUTS_DIR_CANDIDATES:
-            path = (base / candidate).resolve()
-            if path.exists() and path.is_dir() and (path / SPATIAL_DIR).exists():
-                return path
+            path = os.path.join(base, candidate)
+            if os.path.isdir(path) and os.path.exists(os.path.join(path, SPATIAL_DIR)):
+                # Canonicalise only the directory that matched.
+                return Path(path).resolve()
         return None
 
     def _resolve_matrix(self, outs_dir: Path) -> Optional[Path]:
@@ -149,14 +178,13 @@ class VisiumHDAdapter(SpatialAdapter):
             path = spatial_dir / candidate
             if not path.exists():
                 continue
-            df = load_tabular_file(path)
-            normalised = {_normalise_column(col): col for col in df.columns}
+            normalised = {_normalise_column(col): col for col in tabular_columns(path)}
             barcode_col = normalised.get("barcode")
             x_col = normalised.get("pxl_col_in_fullres") or normalised.get("x")
             y_col = normalised.get("pxl_row_in_fullres") or normalised.get("y")
             if not (barcode_col and x_col and y_col):
                 continue
-            positions = df[[barcode_col, x_col, y_col]].copy()
+            positions = load_tabular_file(path, columns=[barcode_col, x_col, y_col])
             positions.columns = ["barcode", "x", "y"]
             return positions
         raise FileNotFoundError("Unable to locate tissue positions for Visium HD dataset.")
@@ -165,9 +193,8 @@ class VisiumHDAdapter(SpatialAdapter):
         scale_path = spatial_dir / SCALEFACTORS_FILE
         if not scale_path.exists():
             return {}
-        with scale_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-        return {key: float(value) for key, value in data.items()}
+        # Keyed on mtime so repeated reads of an unchanged file skip the parse.
+        return dict(_parse_scalefactors(scale_path, scale_path.stat().st_mtime_ns))
 
     def _build_image_layer(
         self,
@@ -198,11 +225,26 @@ class VisiumHDAdapter(SpatialAdapter):
         radius: float,
         pixel_units: str,
     ) -> LabelLayer:
-        polygons = [Point(row["x"], row["y"]).buffer(radius).simplify(0.5).wkt for _, row in spots.iterrows()]
+        # Build, buffer and serialise every spot outline as array operations instead of per-row geometries.
+        x = spots["x"].to_numpy(dtype=float)
+        y = spots["y"].to_numpy(dtype=float)
+        workers = os.cpu_count() or 1
+        if workers > 1 and x.size >= _PARALLEL_OUTLINE_MIN_SPOTS:
+            # GEOS releases the GIL, so chunks of spots buffer concurrently on threads.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(
+                    lambda xs, ys: _spot_outlines(xs, ys, radius),
+                    np.array_split(x, workers),
+                    np.array_split(y, workers),
+                )
+                polygons = np.concatenate(list(chunks)).tolist()
+        else:
+            polygons = _spot_outlines(x, y, radius).tolist()
         return LabelLayer(
             name="visium_hd_spots",
             frame=local_frame.name,
             crs=pixel_units,
+            geometry_format="wkb",
             geometries=polygons,
             properties={"source": "tissue_positions"},
             transform=transform,
@@ -216,7 +258,7 @@ class VisiumHDAdapter(SpatialAdapter):
         transform: AffineTransform,
     ) -> TableLayer:
         adata_path = temporary_output_path(stem="visium-hd-expr", suffix=".h5ad")
-        adata.write(adata_path, compression="gzip")
+        adata.write(adata_path, compression=self.table_compression)
         summary = dataframe_summary(adata.obs.reset_index(drop=True))
         summary.update({"var_count": int(adata.n_vars), "adata_path": str(adata_path)})
         return TableLayer(
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
-from typing import Callable, Dict, Iterable, Tuple
+from typing import Callable, Dict, Iterable, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -12,6 +14,7 @@ import tifffile
 import zarr
 from shapely.affinity import translate
 from shapely.geometry import box as shapely_box
+from typer.testing import CliRunner, Result
 
 from omnispatial.core.model import ProvenanceMetadata
 
@@ -20,7 +23,7 @@ def _write_image(base: Path, shape: Tuple[int, int], data: np.ndarray) -> Path:
     images_dir = base / "images"
     images_dir.mkdir(parents=True, exist_ok=True)
     image_path = images_dir / "synthetic.tif"
-    tifffile.imwrite(image_path, data.astype(np.uint16))
+    tifffile.imwrite(image_path, data.astype(np.uint16), photometric="minisblack")
     return image_path
 
 
@@ -36,11 +39,31 @@ def _write_matrix(base: Path, rows: Iterable[Dict[str, object]]) -> Path:
     return path
 
 
-@pytest.fixture()
-def xenium_synthetic_dataset(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Import the CLI stack and scan adapter entry points once, before the first test runs."""
+    import anndata  # noqa: F401
+
+    import omnispatial.cli  # noqa: F401
+    from omnispatial.adapters import registry
+
+    registry.load_adapter_plugins()
+
+
+def _make_read_only(root: Path) -> Path:
+    # Session-scoped datasets are shared, so any test that writes into one fails loudly instead of leaking state.
+    for path in sorted(root.rglob("*"), reverse=True):
+        path.chmod(0o555 if path.is_dir() else 0o444)
+    root.chmod(0o555)
+    return root
+
+
+# Dataset fixtures are session-scoped: adapters only read their inputs, so one copy serves every test.
+# Tests that need to modify inputs should copy them into tmp_path first (see copy_bundle).
+@pytest.fixture(scope="session")
+def xenium_synthetic_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a synthetic Xenium-like dataset with image and tables."""
-    dataset_path = tmp_path / "xenium_synth"
-    dataset_path.mkdir()
+    dataset_path = tmp_path_factory.mktemp("xenium_synth")
     image_array = np.array(
         [
             [0, 10, 20, 30],
@@ -74,7 +97,7 @@ def xenium_synthetic_dataset(tmp_path: Path) -> Path:
     ]
     _write_cells(dataset_path, cells)
     _write_matrix(dataset_path, matrix)
-    return dataset_path
+    return _make_read_only(dataset_path)
 
 
 def _write_cosmx_image(base: Path) -> Path:
@@ -96,10 +119,9 @@ def _write_cosmx_image(base: Path) -> Path:
     return image_path
 
 
-@pytest.fixture()
-def cosmx_synthetic_dataset(tmp_path: Path) -> Path:
-    dataset_path = tmp_path / "cosmx_synth"
-    dataset_path.mkdir()
+@pytest.fixture(scope="session")
+def cosmx_synthetic_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    dataset_path = tmp_path_factory.mktemp("cosmx_synth")
     _write_cosmx_image(dataset_path)
 
     region_a = shapely_box(0, 0, 1, 1)
@@ -125,13 +147,12 @@ def cosmx_synthetic_dataset(tmp_path: Path) -> Path:
         }
     )
     expr.to_parquet(dataset_path / "expr.parquet")
-    return dataset_path
+    return _make_read_only(dataset_path)
 
 
-@pytest.fixture()
-def merfish_synthetic_dataset(tmp_path: Path) -> Path:
-    dataset_path = tmp_path / "merfish_synth"
-    dataset_path.mkdir()
+@pytest.fixture(scope="session")
+def merfish_synthetic_dataset(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    dataset_path = tmp_path_factory.mktemp("merfish_synth")
     image = np.array(
         [
             [5, 10, 15, 20],
@@ -141,7 +162,7 @@ def merfish_synthetic_dataset(tmp_path: Path) -> Path:
         ],
         dtype=np.uint16,
     )
-    tifffile.imwrite(dataset_path / "image.tif", image)
+    tifffile.imwrite(dataset_path / "image.tif", image, photometric="minisblack")
     spots = pd.DataFrame(
         {
             "x": [0.4, 1.6, 2.4, 0.9],
@@ -151,7 +172,64 @@ def merfish_synthetic_dataset(tmp_path: Path) -> Path:
         }
     )
     spots.to_csv(dataset_path / "spots.csv", index=False)
-    return dataset_path
+    return _make_read_only(dataset_path)
+
+
+@pytest.fixture(scope="session")
+def invoke_cli() -> Callable[[List[str]], Result]:
+    """Return a helper that runs the CLI through one shared runner, letting unexpected exceptions propagate."""
+    from omnispatial.cli import app
+
+    runner = CliRunner()
+
+    def _invoke(args: List[str]) -> Result:
+        return runner.invoke(app, args, catch_exceptions=False)
+
+    return _invoke
+
+
+@pytest.fixture(scope="session")
+def converted_bundle(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    invoke_cli: Callable[[List[str]], Result],
+) -> Callable[[str, str], Path]:
+    """Return a helper that converts a synthetic vendor dataset once per (vendor, format) per session."""
+    bundles: Dict[Tuple[str, str], Path] = {}
+
+    def _convert(vendor: str, fmt: str) -> Path:
+        key = (vendor, fmt)
+        if key not in bundles:
+            input_dir: Path = request.getfixturevalue(f"{vendor}_synthetic_dataset")
+            out_path = tmp_path_factory.mktemp(f"{vendor}_{fmt}") / f"{vendor}.{fmt}.zarr"
+            args = ["convert", str(input_dir), "--out", str(out_path), "--format", fmt, "--vendor", vendor]
+            result = invoke_cli(args)
+            assert result.exit_code == 0, result.stdout
+            bundles[key] = out_path
+        return bundles[key]
+
+    return _convert
+
+
+@pytest.fixture()
+def copy_bundle() -> Callable[[Path, Path], Path]:
+    """Return a helper that copies a shared bundle for tests that mutate it.
+
+    Files are hard-linked; Zarr rewrites metadata by replacing files, so edits never reach the shared copy.
+    """
+
+    def _link_or_copy(src: str, dst: str) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            # Hard links cannot cross filesystems (or may be unsupported); fall back to a real copy.
+            shutil.copy2(src, dst)
+
+    def _copy(source: Path, destination: Path) -> Path:
+        shutil.copytree(source, destination, copy_function=_link_or_copy)
+        return destination
+
+    return _copy
 
 
 @pytest.fixture()
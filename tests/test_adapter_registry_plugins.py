@@ -42,7 +42,9 @@ class _PluginAdapter(SpatialAdapter):
 def reset_registry(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(registry, "_REGISTERED_ADAPTERS", {})
     monkeypatch.setattr(registry, "_ENTRYPOINTS_LOADED", False)
+    registry._cached_entry_points.cache_clear()
     yield
+    registry._cached_entry_points.cache_clear()
 
 
 def test_load_adapter_plugins_registers_entry_points(monkeypatch: pytest.MonkeyPatch, reset_registry) -> None:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
 import pytest
@@ -13,6 +14,8 @@ from omnispatial.adapters.base import SpatialAdapter
 from omnispatial.core.model import AffineTransform, CoordinateFrame, ImageLayer, ProvenanceMetadata, SpatialDataset
 from omnispatial.validate import ValidationReport
 
+_EXAMPLE_REPORT = ValidationReport.example()
+
 
 def _identity_transform(source: str, target: str) -> AffineTransform:
     return AffineTransform(
@@ -67,9 +70,19 @@ class _APIAdapter(SpatialAdapter):
         return self._dataset
 
 
-@pytest.fixture
-def image_path(tmp_path: Path) -> Path:
-    path = tmp_path / "image.tif"
+@pytest.fixture(scope="module")
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.run_until_complete(loop.shutdown_default_executor())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def image_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Adapters only read the image, so one file serves every test in the session.
+    path = tmp_path_factory.mktemp("api_image") / "image.tif"
     tifffile.imwrite(path, np.ones((4, 4), dtype=np.uint16))
     return path
 
@@ -102,9 +115,11 @@ def test_convert_writes_ngff(tmp_path: Path, stub_adapter: SpatialDataset) -> No
     assert result.dataset.images[0].name == "img"
 
 
-def test_convert_async(tmp_path: Path, stub_adapter: SpatialDataset) -> None:
+def test_convert_async(
+    event_loop: asyncio.AbstractEventLoop, tmp_path: Path, stub_adapter: SpatialDataset
+) -> None:
     target = tmp_path / "async.zarr"
-    result = asyncio.run(api.convert_async(tmp_path, target, vendor="api-test", output_format="ngff"))
+    result = event_loop.run_until_complete(api.convert_async(tmp_path, target, vendor="api-test", output_format="ngff"))
     assert result.output_path == target
 
 
@@ -115,15 +130,17 @@ def test_convert_dry_run(tmp_path: Path, stub_adapter: SpatialDataset) -> None:
     assert result.dataset.provenance.adapter == "test-adapter"
 
 
-def test_validate_delegates(monkeypatch: pytest.MonkeyPatch) -> None:
-    report = ValidationReport.example()
-    monkeypatch.setattr(api, "_validate_bundle", lambda bundle, fmt: report)
+@pytest.fixture
+def patched_validate(monkeypatch: pytest.MonkeyPatch) -> ValidationReport:
+    monkeypatch.setattr(api, "_validate_bundle", lambda bundle, fmt: _EXAMPLE_REPORT)
+    return _EXAMPLE_REPORT
+
+
+def test_validate_delegates(patched_validate: ValidationReport) -> None:
     outcome = api.validate("bundle", output_format="ngff")
-    assert outcome is report
+    assert outcome is patched_validate
 
 
-def test_validate_async(monkeypatch: pytest.MonkeyPatch) -> None:
-    report = ValidationReport.example()
-    monkeypatch.setattr(api, "_validate_bundle", lambda bundle, fmt: report)
-    outcome = asyncio.run(api.validate_async("bundle", output_format="spatialdata"))
-    assert outcome is report
+def test_validate_async(event_loop: asyncio.AbstractEventLoop, patched_validate: ValidationReport) -> None:
+    outcome = event_loop.run_until_complete(api.validate_async("bundle", output_format="spatialdata"))
+    assert outcome is patched_validate
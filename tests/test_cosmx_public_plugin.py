@@ -0,0 +1,51 @@
+"""Tests for the CosMx public release adapter plugin."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import anndata as ad
+import numpy as np
+import pandas as pd
+import pytest
+import zarr
+
+cosmx_public = pytest.importorskip("omnispatial_adapters.cosmx_public")
+
+
+def _write_public_dataset(base: Path, expression: pd.DataFrame) -> Path:
+    zarr.save_array(str(base / "image.zarr"), np.zeros((1, 4, 4), dtype=np.uint16))
+    pd.DataFrame(
+        {
+            "cell_id": ["cell_a", "cell_b"],
+            "centroid_x": [0.5, 1.5],
+            "centroid_y": [0.5, 1.5],
+            "region": ["R1", "R1"],
+            "polygon_wkt": [
+                "POLYGON ((0 0, 1 0, 1 1, 0 1, 0 0))",
+                "POLYGON ((1 1, 2 1, 2 2, 1 2, 1 1))",
+            ],
+        }
+    ).to_csv(base / "cells.csv", index=False)
+    expression.to_csv(base / "exprMat_file.csv", index=False)
+    return base
+
+
+def test_cosmx_public_skips_missing_counts(tmp_path: Path) -> None:
+    expression = pd.DataFrame(
+        {
+            "cell_id": ["cell_a", "cell_a", "cell_a", "cell_b"],
+            "target": ["T1", "T1", "T2", "T2"],
+            "count": [1.0, np.nan, 0.0, 4.0],
+        }
+    )
+    dataset_path = _write_public_dataset(tmp_path, expression)
+
+    adapter = cosmx_public.CosMxPublicAdapter()
+    assert adapter.detect(dataset_path)
+    dataset = adapter.read(dataset_path)
+
+    adata = ad.read_h5ad(dataset.tables[0].adata_path)
+    assert list(adata.obs_names) == ["cell_a", "cell_b"]
+    assert list(adata.var_names) == ["T1", "T2"]
+    np.testing.assert_array_equal(adata.X.toarray(), [[1.0, 0.0], [0.0, 4.0]])
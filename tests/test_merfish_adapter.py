@@ -7,9 +7,10 @@ from pathlib import Path
 import anndata as ad
 import numpy as np
 import pandas as pd
+import shapely
 
 from omnispatial.adapters.merfish import PIXEL_SIZE, MerfishAdapter
-from omnispatial.utils import read_image_any
+from omnispatial.utils import probe_image_shape
 
 
 def test_merfish_adapter_bins_and_counts(merfish_synthetic_dataset: Path) -> None:
@@ -19,17 +20,16 @@ def test_merfish_adapter_bins_and_counts(merfish_synthetic_dataset: Path) -> Non
 
     image_layer = dataset.images[0]
     assert image_layer.pixel_size == (PIXEL_SIZE, PIXEL_SIZE, 1.0)
-    image_data, _ = read_image_any(image_layer.path)
-    assert image_data.shape[-2:] == (4, 4)
+    image_shape = probe_image_shape(image_layer.path)
+    assert image_shape[-2:] == (4, 4)
 
     label_layer = dataset.labels[0]
-    polygons = list(label_layer.iter_geometries())
-    assert len(polygons) == 2
-    for polygon in polygons:
-        assert polygon.is_valid
+    assert len(label_layer) == 2
+    assert label_layer.all_valid()
+    polygons = np.asarray(list(label_layer.iter_geometries()), dtype=object)
 
-    centroids = [polygon.centroid.x for polygon in polygons]
-    assert centroids[1] > centroids[0]
+    centroid_x = shapely.get_x(shapely.centroid(polygons))
+    assert centroid_x[1] > centroid_x[0]
 
     table_layer = dataset.tables[0]
     assert table_layer.summary["obs_count"] == 2
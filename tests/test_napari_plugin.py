@@ -6,32 +6,15 @@ from pathlib import Path
 
 import numpy as np
 import pytest
-from typer.testing import CliRunner
+import zarr
 
 from omnispatial.adapters.xenium import XeniumAdapter
-from omnispatial.cli import app
 from omnispatial.napari_plugin import omnispatial_reader
 
-runner = CliRunner()
-
 
 @pytest.fixture()
-def xenium_bundle(tmp_path: Path, xenium_synthetic_dataset: Path) -> Path:
-    adapter = XeniumAdapter()
-    out_path = tmp_path / "xenium_bundle.zarr"
-    args = [
-        "convert",
-        str(xenium_synthetic_dataset),
-        "--out",
-        str(out_path),
-        "--format",
-        "ngff",
-        "--vendor",
-        adapter.name,
-    ]
-    result = runner.invoke(app, args)
-    assert result.exit_code == 0, result.stdout
-    return out_path
+def xenium_bundle(converted_bundle) -> Path:
+    return converted_bundle(XeniumAdapter.name, "ngff")
 
 
 def test_reader_produces_layers(xenium_bundle: Path) -> None:
@@ -50,8 +33,11 @@ def test_reader_produces_layers(xenium_bundle: Path) -> None:
 
 
 def test_reader_points_properties(xenium_bundle: Path) -> None:
-    layers = omnispatial_reader(str(xenium_bundle))
+    layers = omnispatial_reader(str(xenium_bundle), lazy=True)
     assert layers is not None
+    image_data, meta, _ = layers[0]
+    root = zarr.open_group(str(xenium_bundle), mode="r")
+    assert image_data.shape[-2:] == root["images"][meta["name"]]["0"].shape[-2:]
     points_layer = next((layer for layer in layers if layer[2] == "points"), None)
     assert points_layer is not None
     data, meta, _ = points_layer
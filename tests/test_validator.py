@@ -2,41 +2,43 @@
 
 from __future__ import annotations
 
+import importlib.util
 import json
 from pathlib import Path
 
 import pytest
 import zarr
-from typer.testing import CliRunner
 
 from omnispatial.adapters.xenium import XeniumAdapter
-from omnispatial.cli import app
+from omnispatial.validate import validate_bundle
 
-runner = CliRunner()
+SPATIALDATA_FORMAT = pytest.param(
+    "spatialdata",
+    marks=pytest.mark.skipif(importlib.util.find_spec("spatialdata") is None, reason="spatialdata is not installed"),
+)
 
 
-def _convert_dataset(adapter, input_dir: Path, out_path: Path, fmt: str) -> None:
-    args = ["convert", str(input_dir), "--out", str(out_path), "--format", fmt, "--vendor", adapter.name]
-    result = runner.invoke(app, args)
-    assert result.exit_code == 0, result.stdout
-
-
-def _run_validate(bundle: Path, fmt: str, json_path: Path) -> tuple[int, dict]:
+def _run_validate(invoke_cli, bundle: Path, fmt: str, json_path: Path) -> tuple[int, dict]:
     args = ["validate", str(bundle), "--format", fmt, "--json", str(json_path)]
-    result = runner.invoke(app, args)
+    result = invoke_cli(args)
     assert json_path.exists(), "JSON report was not written"
     data = json.loads(json_path.read_text())
     return result.exit_code, data
 
 
-@pytest.mark.parametrize("fmt", ["ngff", "spatialdata"])
-def test_validator_ok(xenium_synthetic_dataset: Path, tmp_path: Path, fmt: str) -> None:
-    adapter = XeniumAdapter()
-    out_path = tmp_path / f"bundle.{fmt}.zarr"
-    _convert_dataset(adapter, xenium_synthetic_dataset, out_path, fmt)
+def _drop_multiscales(group: zarr.Group) -> None:
+    # Rewrite .zattrs once rather than issuing a read-modify-write per key.
+    attrs = group.attrs.asdict()
+    attrs.pop("multiscales", None)
+    group.attrs.put(attrs)
+
+
+@pytest.mark.parametrize("fmt", ["ngff", SPATIALDATA_FORMAT])
+def test_validator_ok(converted_bundle, invoke_cli, tmp_path: Path, fmt: str) -> None:
+    out_path = converted_bundle(XeniumAdapter.name, fmt)
     json_path = tmp_path / f"report_{fmt}.json"
 
-    exit_code, data = _run_validate(out_path, fmt, json_path)
+    exit_code, data = _run_validate(invoke_cli, out_path, fmt, json_path)
     assert exit_code == 0
     assert data["ok"] is True
     assert data["summary"]["format"] == fmt
@@ -44,19 +46,48 @@ def test_validator_ok(xenium_synthetic_dataset: Path, tmp_path: Path, fmt: str)
     assert "provenance" in data["summary"]
 
 
-def test_validator_detects_missing_metadata(xenium_synthetic_dataset: Path, tmp_path: Path) -> None:
-    adapter = XeniumAdapter()
-    out_path = tmp_path / "bundle_ngff.zarr"
-    _convert_dataset(adapter, xenium_synthetic_dataset, out_path, "ngff")
+def test_validator_detects_missing_metadata(converted_bundle, invoke_cli, copy_bundle, tmp_path: Path) -> None:
+    out_path = copy_bundle(converted_bundle(XeniumAdapter.name, "ngff"), tmp_path / "bundle_ngff.zarr")
 
     store = zarr.open_group(str(out_path), mode="r+")
     image_group_name = next(iter(store["images"].group_keys()))
-    del store["images"][image_group_name].attrs["multiscales"]
+    _drop_multiscales(store["images"][image_group_name])
 
     json_path = tmp_path / "broken_report.json"
-    exit_code, data = _run_validate(out_path, "ngff", json_path)
+    exit_code, data = _run_validate(invoke_cli, out_path, "ngff", json_path)
     assert exit_code == 1
     codes = {issue["code"] for issue in data["issues"]}
     assert "NGFF_METADATA_MISSING" in codes
     severities = {issue["severity"] for issue in data["issues"]}
     assert "error" in severities
+
+
+def test_validator_fail_fast_stops_at_first_error(converted_bundle, invoke_cli, copy_bundle, tmp_path: Path) -> None:
+    out_path = copy_bundle(converted_bundle(XeniumAdapter.name, "ngff"), tmp_path / "bundle_fail_fast.zarr")
+
+    store = zarr.open_group(str(out_path), mode="r+")
+    image_group_name = next(iter(store["images"].group_keys()))
+    _drop_multiscales(store["images"][image_group_name])
+    label_group_name = next(iter(store["labels"].group_keys()))
+    _drop_multiscales(store["labels"][label_group_name])
+
+    json_path = tmp_path / "fail_fast_report.json"
+    args = ["validate", str(out_path), "--format", "ngff", "--json", str(json_path), "--fail-fast"]
+    result = invoke_cli(args)
+    assert result.exit_code == 1
+    data = json.loads(json_path.read_text())
+    errors = [issue for issue in data["issues"] if issue["severity"] == "error"]
+    assert [issue["code"] for issue in errors] == ["NGFF_METADATA_MISSING"]
+
+
+def test_validator_parallel_matches_sequential(converted_bundle, copy_bundle, tmp_path: Path) -> None:
+    out_path = copy_bundle(converted_bundle(XeniumAdapter.name, "ngff"), tmp_path / "bundle_parallel.zarr")
+
+    store = zarr.open_group(str(out_path), mode="r+")
+    label_group_name = next(iter(store["labels"].group_keys()))
+    _drop_multiscales(store["labels"][label_group_name])
+
+    parallel = validate_bundle(out_path, "ngff")
+    sequential = validate_bundle(out_path, "ngff", parallel=False)
+    assert parallel.model_dump() == sequential.model_dump()
+    assert not parallel.ok
@@ -2,26 +2,44 @@
 
 from __future__ import annotations
 
+import importlib.util
+import io
 import json
-import subprocess
-import sys
+from contextlib import redirect_stdout
 from pathlib import Path
+from types import ModuleType
+from typing import Optional
 
 
 SCRIPT_PATH = Path(__file__).resolve().parents[1] / "examples" / "workflows" / "scripts" / "run_omnispatial.py"
+_SCRIPT_MODULE: Optional[ModuleType] = None
 
 
-def _run_cli(args: list[str]) -> subprocess.CompletedProcess[str]:
-    """Execute the workflow CLI helper and return the completed process."""
-    cmd = [sys.executable, str(SCRIPT_PATH), *args]
-    return subprocess.run(cmd, capture_output=True, text=True, check=True)
+def _load_script() -> ModuleType:
+    """Import the workflow helper once so every call reuses the already-imported OmniSpatial stack."""
+    global _SCRIPT_MODULE
+    if _SCRIPT_MODULE is None:
+        spec = importlib.util.spec_from_file_location("run_omnispatial", SCRIPT_PATH)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SCRIPT_MODULE = module
+    return _SCRIPT_MODULE
+
+
+def _run_cli(args: list[str]) -> str:
+    """Run the workflow CLI helper in-process and return its captured stdout."""
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        _load_script().main(args)
+    return buffer.getvalue()
 
 
 def test_convert_and_validate_roundtrip(tmp_path: Path, xenium_synthetic_dataset: Path) -> None:
     """Conversion followed by validation emits JSON summaries and writes bundles."""
     output_bundle = tmp_path / "xenium_bundle.ngff.zarr"
 
-    convert_result = _run_cli(
+    convert_stdout = _run_cli(
         [
             "convert",
             "--input",
@@ -36,14 +54,14 @@ def test_convert_and_validate_roundtrip(tmp_path: Path, xenium_synthetic_dataset
         ]
     )
 
-    convert_lines = [line for line in convert_result.stdout.splitlines() if line.strip()]
-    assert convert_lines, convert_result.stdout
+    convert_lines = [line for line in convert_stdout.splitlines() if line.strip()]
+    assert convert_lines, convert_stdout
     convert_payload = json.loads(convert_lines[-1])
     assert convert_payload["adapter"] == "xenium"
     assert convert_payload["format"] == "ngff"
     assert output_bundle.exists() and output_bundle.is_dir()
 
-    validate_result = _run_cli(
+    validate_stdout = _run_cli(
         [
             "validate",
             str(output_bundle),
@@ -53,7 +71,7 @@ def test_convert_and_validate_roundtrip(tmp_path: Path, xenium_synthetic_dataset
         ]
     )
 
-    validation_payload = json.loads(validate_result.stdout)
+    validation_payload = json.loads(validate_stdout)
     assert validation_payload["ok"] is True
     assert validation_payload["summary"]["format"] == "ngff"
     assert validation_payload["summary"]["target"].endswith("xenium_bundle.ngff.zarr")
@@ -2,108 +2,111 @@
 
 from __future__ import annotations
 
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
 
 import anndata as ad
+import h5py
 import numpy as np
 import pytest
 import zarr
-from typer.testing import CliRunner
 
 from omnispatial.adapters.cosmx import CosMxAdapter
 from omnispatial.adapters.merfish import MerfishAdapter
 from omnispatial.adapters.xenium import XeniumAdapter
-from omnispatial.cli import app
-from omnispatial.utils import read_image_any
+from omnispatial.utils import probe_image_shape
 
-runner = CliRunner()
+# Skip at collection so the SpatialData writer never runs when the reader is unavailable.
+requires_spatialdata = pytest.mark.skipif(
+    importlib.util.find_spec("spatialdata") is None, reason="spatialdata is not installed"
+)
+
+# Vendors share no state, so each gets its own xdist group (``pytest -n auto --dist loadgroup``).
+VENDOR_ADAPTERS = [
+    pytest.param(
+        adapter_cls,
+        id=adapter_cls.name,
+        marks=pytest.mark.xdist_group(name=f"writer_roundtrip_{adapter_cls.name}"),
+    )
+    for adapter_cls in (XeniumAdapter, CosMxAdapter, MerfishAdapter)
+]
 
 
-def _invoke_convert(input_dir: Path, out_path: Path, fmt: str, vendor: str | None = None) -> None:
-    args = ["convert", str(input_dir), "--out", str(out_path), "--format", fmt]
-    if vendor:
-        args.extend(["--vendor", vendor])
-    result = runner.invoke(app, args)
-    assert result.exit_code == 0, result.stdout
+def _stored_x_sum(matrix) -> float:
+    # Works for both h5py and Zarr nodes; sparse matrices only need their stored values.
+    if not hasattr(matrix, "shape"):
+        matrix = matrix["data"]
+    total = np.float64(0.0)
+    step = max(1, matrix.chunks[0] if matrix.chunks else 65536)
+    for start in range(0, matrix.shape[0], step):
+        total += np.add.reduce(matrix[start : start + step], axis=None, dtype=np.float64)
+    return float(total)
+
+
+@lru_cache(maxsize=16)
+def _h5ad_x_sum(path: str, mtime_ns: int) -> float:
+    with h5py.File(path, "r") as handle:
+        return _stored_x_sum(handle["X"])
+
 
+def _adata_x_sum(path: Path) -> float:
+    """Return the sum of X from an ``.h5ad`` file without building an AnnData object."""
+    path = Path(path)
+    return _h5ad_x_sum(str(path), path.stat().st_mtime_ns)
 
-def _open_ngff(path: Path, image_name: str, table_name: str) -> Tuple[np.ndarray, ad.AnnData]:
+
+@lru_cache(maxsize=32)
+def _source_image_shape(path: str) -> Tuple[int, ...]:
+    # Synthetic inputs are read-only for the session, so no invalidation is needed.
+    return probe_image_shape(Path(path))
+
+
+def _open_ngff(path: Path, image_name: str, table_name: str) -> Tuple[zarr.Array, float]:
     store = zarr.open_group(str(path), mode="r")
-    image_data = store["images"][image_name]["0"][:]
-    adata = ad.read_zarr(str(path / "tables" / table_name))
-    return image_data, adata
+    image_data = store["images"][image_name]["0"]
+    table_x_sum = _stored_x_sum(store["tables"][table_name]["X"])
+    return image_data, table_x_sum
 
 
-@pytest.mark.parametrize(
-    "fixture_name", ["xenium_synthetic_dataset", "cosmx_synthetic_dataset", "merfish_synthetic_dataset"]
-)
-def test_convert_to_ngff(request, fixture_name: str, tmp_path: Path) -> None:
-    input_dir: Path = request.getfixturevalue(fixture_name)
-    if fixture_name == "xenium_synthetic_dataset":
-        adapter = XeniumAdapter()
-        vendor = "xenium"
-    elif fixture_name == "cosmx_synthetic_dataset":
-        adapter = CosMxAdapter()
-        vendor = "cosmx"
-    else:
-        adapter = MerfishAdapter()
-        vendor = "merfish"
-
-    dataset = adapter.read(input_dir)
-    out_path = tmp_path / f"{vendor}_ngff.zarr"
-    _invoke_convert(input_dir, out_path, "ngff", vendor)
-
-    image_data, adata = _open_ngff(out_path, dataset.images[0].name, dataset.tables[0].name)
-    original_image, _ = read_image_any(Path(dataset.images[0].path))  # type: ignore[arg-type]
-    if original_image.ndim == 2:
-        original_shape = original_image.shape
-    else:
-        original_shape = original_image.shape[-2:]
-    assert image_data.shape[-2:] == original_shape
-    original_table = ad.read_h5ad(dataset.tables[0].adata_path)
-    assert np.isclose(float(adata.X.sum()), float(original_table.X.sum()))
+@pytest.mark.parametrize("adapter_cls", VENDOR_ADAPTERS)
+def test_convert_to_ngff(request, adapter_cls, converted_bundle) -> None:
+    adapter = adapter_cls()
+    vendor = adapter.name
+    dataset = adapter.read(request.getfixturevalue(f"{vendor}_synthetic_dataset"))
+    out_path = converted_bundle(vendor, "ngff")
+
+    image_data, table_x_sum = _open_ngff(out_path, dataset.images[0].name, dataset.tables[0].name)
+    assert image_data.shape[-2:] == _source_image_shape(str(dataset.images[0].path))[-2:]
+    assert np.isclose(table_x_sum, _adata_x_sum(dataset.tables[0].adata_path))
     root = zarr.open_group(str(out_path), mode="r")
     assert "omnispatial_provenance" in root.attrs
 
 
-@pytest.mark.parametrize(
-    "fixture_name", ["xenium_synthetic_dataset", "cosmx_synthetic_dataset", "merfish_synthetic_dataset"]
-)
-def test_convert_to_spatialdata(request, fixture_name: str, tmp_path: Path) -> None:
-    spatialdata = pytest.importorskip("spatialdata")
+@requires_spatialdata
+@pytest.mark.parametrize("adapter_cls", VENDOR_ADAPTERS)
+def test_convert_to_spatialdata(request, adapter_cls, converted_bundle) -> None:
     from spatialdata.io import read_zarr
 
-    input_dir: Path = request.getfixturevalue(fixture_name)
-    if fixture_name == "xenium_synthetic_dataset":
-        adapter = XeniumAdapter()
-        vendor = "xenium"
-    elif fixture_name == "cosmx_synthetic_dataset":
-        adapter = CosMxAdapter()
-        vendor = "cosmx"
-    else:
-        adapter = MerfishAdapter()
-        vendor = "merfish"
-
-    dataset = adapter.read(input_dir)
-    out_path = tmp_path / f"{vendor}_sdata.zarr"
-    _invoke_convert(input_dir, out_path, "spatialdata", vendor)
+    adapter = adapter_cls()
+    vendor = adapter.name
+    dataset = adapter.read(request.getfixturevalue(f"{vendor}_synthetic_dataset"))
+    out_path = converted_bundle(vendor, "spatialdata")
 
     sdata = read_zarr(str(out_path))
     image_key = next(iter(sdata.images))
     image = sdata.images[image_key]
     image_array = image.xdata if hasattr(image, "xdata") else image
-    image_values = np.asarray(image_array.values if hasattr(image_array, "values") else image_array)
-    assert image_values.shape[-2:] == np.asarray(read_image_any(Path(dataset.images[0].path))[0]).shape[-2:]  # type: ignore[arg-type]
+    assert tuple(image_array.shape[-2:]) == _source_image_shape(str(dataset.images[0].path))[-2:]
 
     table = sdata.table
-    assert np.isclose(float(table.X.sum()), float(ad.read_h5ad(dataset.tables[0].adata_path).X.sum()))
+    assert np.isclose(float(table.X.sum()), _adata_x_sum(dataset.tables[0].adata_path))
 
 
-def test_convert_dry_run(tmp_path: Path, xenium_synthetic_dataset: Path) -> None:
+def test_convert_dry_run(invoke_cli, tmp_path: Path, xenium_synthetic_dataset: Path) -> None:
     out_path = tmp_path / "dry_run.zarr"
-    result = runner.invoke(
-        app,
+    result = invoke_cli(
         [
             "convert",
             str(xenium_synthetic_dataset),
@@ -112,18 +115,17 @@ def test_convert_dry_run(tmp_path: Path, xenium_synthetic_dataset: Path) -> None
             "--out",
             str(out_path),
             "--dry-run",
-        ],
+        ]
     )
     assert result.exit_code == 0, result.stdout
     assert not out_path.exists()
 
 
-def test_ngff_contains_labels_and_tables(tmp_path: Path, xenium_synthetic_dataset: Path) -> None:
+def test_ngff_contains_labels_and_tables(converted_bundle, xenium_synthetic_dataset: Path) -> None:
     """Regression test: ensure NGFF conversion keeps label masks and AnnData tables."""
     adapter = XeniumAdapter()
     dataset = adapter.read(xenium_synthetic_dataset)
-    out_path = tmp_path / "xenium_bundle.zarr"
-    _invoke_convert(xenium_synthetic_dataset, out_path, "ngff", "xenium")
+    out_path = converted_bundle(adapter.name, "ngff")
 
     root = zarr.open_group(str(out_path), mode="r")
     labels_group = root.get("labels")
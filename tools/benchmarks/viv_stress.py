@@ -6,13 +6,16 @@ from __future__ import annotations
 import argparse
 import json
 import math
-import random
+import os
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import zarr
+from numcodecs import blosc
 
 
 def discover_image(store: zarr.Group) -> Tuple[str, zarr.Array]:
@@ -31,37 +34,135 @@ def discover_image(store: zarr.Group) -> Tuple[str, zarr.Array]:
     raise RuntimeError("Unable to locate multiscale image array in store.")
 
 
-def sample_chunks(array: zarr.Array, samples: int) -> Dict[str, float]:
-    """Read random chunks from the array and collect throughput metrics."""
+def chunk_selections(array: zarr.Array, samples: int, seed: Optional[int] = None) -> List[Tuple[slice, ...]]:
+    """Pick up to ``samples`` distinct chunks uniformly from the chunk grid."""
     chunk_sizes = array.chunks
     shape = array.shape
+    grid = tuple(max(1, math.ceil(dim_size / chunk)) for dim_size, chunk in zip(shape, chunk_sizes))
+    n_chunks = math.prod(grid)
+    rng = np.random.default_rng(seed)
+    # Sampling without replacement keeps repeated chunks from inflating throughput via caches.
+    flat_indices = rng.choice(n_chunks, size=min(samples, n_chunks), replace=False)
+    return [
+        tuple(
+            slice(index * chunk, min((index + 1) * chunk, dim_size))
+            for index, chunk, dim_size in zip(chunk_index, chunk_sizes, shape)
+        )
+        for chunk_index in zip(*np.unravel_index(flat_indices, grid))
+    ]
+
+
+def sample_chunks(
+    array: zarr.Array,
+    samples: int,
+    concurrency: int = 16,
+    requests: Optional[List[Tuple[slice, ...]]] = None,
+) -> Dict[str, float]:
+    """Read random chunks from the array and collect throughput metrics.
+
+    Reads are issued from a thread pool, mimicking Viv's concurrent tile requests; latency is
+    averaged per request while throughput is measured against overall wall time.
+    """
     dtype_size = array.dtype.itemsize
+    if requests is None:
+        requests = chunk_selections(array, samples)
+
+    def read_one(selection: Tuple[slice, ...]) -> Tuple[float, int]:
+        start_time = time.perf_counter()
+        block = array[selection]
+        return time.perf_counter() - start_time, block.size * dtype_size
+
     timings: List[float] = []
     bytes_read: List[int] = []
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for future in as_completed([executor.submit(read_one, selection) for selection in requests]):
+            duration, nbytes = future.result()
+            timings.append(duration)
+            bytes_read.append(nbytes)
+    wall_time = time.perf_counter() - wall_start
+
+    return _summarise(array, timings, sum(bytes_read), wall_time, concurrency)
+
+
+def supports_pipeline(array: zarr.Array) -> bool:
+    """Whether the array exposes the zarr v2 internals used by :func:`pipeline_chunks`."""
+    return hasattr(array, "_chunk_key") and hasattr(array, "_decode_chunk") and array.chunk_store is not None
+
+
+def pipeline_chunks(
+    array: zarr.Array,
+    samples: int,
+    concurrency: int = 16,
+    requests: Optional[List[Tuple[slice, ...]]] = None,
+    queue_depth: int = 4,
+) -> Dict[str, float]:
+    """Read random chunks with fetching and decompression overlapped.
+
+    Fetcher threads pull compressed chunk bytes straight from the store into a bounded
+    queue while the main thread decodes them, where Blosc may use its own thread pool.
+    Latency covers fetch, queueing and decode for each request.
+    """
+    chunk_sizes = array.chunks
+    dtype_size = array.dtype.itemsize
+    chunk_store = array.chunk_store
+    if requests is None:
+        requests = chunk_selections(array, samples)
+    staged: "queue.Queue[Tuple[float, Tuple[slice, ...], object]]" = queue.Queue(maxsize=max(1, queue_depth))
 
-    for _ in range(samples):
-        slices = []
-        for dim, (dim_size, chunk) in enumerate(zip(shape, chunk_sizes)):
-            max_index = max(1, math.ceil(dim_size / chunk))
-            chunk_index = random.randrange(max_index)
-            start = chunk_index * chunk
-            stop = min(start + chunk, dim_size)
-            slices.append(slice(start, stop))
+    def fetch(selection: Tuple[slice, ...]) -> None:
         start_time = time.perf_counter()
-        block = array[tuple(slices)]
-        duration = time.perf_counter() - start_time
-        timings.append(duration)
-        bytes_read.append(block.size * dtype_size)
+        coords = tuple(axis.start // chunk for axis, chunk in zip(selection, chunk_sizes))
+        try:
+            payload: object = chunk_store[array._chunk_key(coords)]
+        except KeyError:
+            payload = None  # Never written; the reader would return the fill value.
+        except Exception as exc:  # pragma: no cover - store failure, re-raised below
+            payload = exc
+        staged.put((start_time, selection, payload))
 
-    total_bytes = sum(bytes_read)
-    total_time = sum(timings)
+    timings: List[float] = []
+    total_bytes = 0
+    error: Optional[BaseException] = None
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for selection in requests:
+            executor.submit(fetch, selection)
+        # Every request is drained even after a failure so no fetcher stays blocked on put().
+        for _ in requests:
+            start_time, selection, payload = staged.get()
+            if isinstance(payload, BaseException):
+                error = error or payload
+            if error is not None:
+                continue
+            if payload is not None:
+                try:
+                    array._decode_chunk(payload)
+                except Exception as exc:  # re-raised once the queue is drained
+                    error = exc
+                    continue
+            timings.append(time.perf_counter() - start_time)
+            total_bytes += math.prod(axis.stop - axis.start for axis in selection) * dtype_size
+    wall_time = time.perf_counter() - wall_start
+    if error is not None:
+        raise error
+
+    return _summarise(array, timings, total_bytes, wall_time, concurrency)
+
+
+def _summarise(
+    array: zarr.Array, timings: List[float], total_bytes: int, wall_time: float, concurrency: int
+) -> Dict[str, float]:
+    samples = len(timings)
     return {
         "samples": samples,
-        "avg_mb_per_s": (total_bytes / (1024**2)) / total_time if total_time else 0.0,
-        "avg_latency_ms": (total_time / samples) * 1000 if samples else 0.0,
+        "concurrency": concurrency,
+        "avg_mb_per_s": (total_bytes / (1024**2)) / wall_time if wall_time else 0.0,
+        "avg_latency_ms": (sum(timings) / samples) * 1000 if samples else 0.0,
         "bytes_read_mb": total_bytes / (1024**2),
-        "chunk_shape": chunk_sizes,
-        "array_shape": shape,
+        "wall_time_s": wall_time,
+        "chunk_shape": array.chunks,
+        "array_shape": array.shape,
         "dtype": str(array.dtype),
     }
 
@@ -71,18 +172,25 @@ def create_synthetic_store(path: Path, size: int, channels: int) -> Path:
     root = zarr.open_group(str(path), mode="w")
     img_group = root.create_group("images")
     dataset = img_group.create_group("synthetic")
-    multiscale = dataset.create_group("0")
     shape = (channels, size, size)
     chunks = (1, min(512, size), min(512, size))
-    array = multiscale.create_dataset(
+    array = dataset.create_dataset(
         "0",
         shape=shape,
         chunks=chunks,
         dtype="uint16",
         compressor=zarr.Blosc(cname="zstd", clevel=5, shuffle=zarr.Blosc.BITSHUFFLE),
     )
+    blosc.set_nthreads(os.cpu_count() or 1)
     rng = np.random.default_rng(42)
-    array[:] = rng.integers(0, 4096, size=shape, dtype="uint16")
+    # Fill one chunk at a time so peak memory stays at a single block, not the whole image.
+    for channel in range(channels):
+        for y0 in range(0, size, chunks[1]):
+            for x0 in range(0, size, chunks[2]):
+                block_shape = (1, min(chunks[1], size - y0), min(chunks[2], size - x0))
+                array[channel : channel + 1, y0 : y0 + block_shape[1], x0 : x0 + block_shape[2]] = rng.integers(
+                    0, 4096, size=block_shape, dtype="uint16"
+                )
     return path
 
 
@@ -90,6 +198,18 @@ def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("store", type=Path, help="Path or URL to an OME-NGFF store.")
     parser.add_argument("--samples", type=int, default=128, help="Number of random chunks to read (default: 128).")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent chunk reads in flight (default: 16).")
+    parser.add_argument("--seed", type=int, help="Seed for chunk selection (default: random).")
+    parser.add_argument(
+        "--cache-gb",
+        type=float,
+        help="Wrap the store in an LRU cache of this size and report a second, warm pass over the same chunks.",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Overlap chunk fetches with decompression through a bounded queue (zarr v2 stores).",
+    )
     parser.add_argument("--report", type=Path, help="Optional JSON file to write metrics.")
     parser.add_argument("--synthetic", type=int, help="Generate a synthetic pyramid with the provided edge length in pixels.")
     parser.add_argument("--channels", type=int, default=4, help="Channel count for synthetic pyramids (default: 4).")
@@ -98,9 +218,21 @@ def main() -> None:
     if args.synthetic:
         create_synthetic_store(args.store, args.synthetic, args.channels)
 
-    store = zarr.open_group(str(args.store), mode="r")
+    store_arg: object = str(args.store)
+    if args.cache_gb:
+        store_arg = zarr.LRUStoreCache(
+            zarr.storage.normalize_store_arg(str(args.store), mode="r"), max_size=int(args.cache_gb * 1024**3)
+        )
+    store = zarr.open_group(store_arg, mode="r")
     image_path, array = discover_image(store)
-    metrics = sample_chunks(array, samples=args.samples)
+    requests = chunk_selections(array, args.samples, seed=args.seed)
+    pipelined = args.pipeline and supports_pipeline(array)
+    reader = pipeline_chunks if pipelined else sample_chunks
+    metrics = reader(array, samples=args.samples, concurrency=args.concurrency, requests=requests)
+    metrics["pipelined"] = pipelined
+    if args.cache_gb:
+        # Replay the same chunks against the now-populated cache for a steady-state number.
+        metrics["warm"] = reader(array, samples=args.samples, concurrency=args.concurrency, requests=requests)
     metrics.update({"store": str(args.store), "image_path": image_path})
     print(json.dumps(metrics, indent=2))
     if args.report:
@@ -5,13 +5,20 @@ from __future__ import annotations
 
 import argparse
 import hashlib
+import io
 import json
 import os
+import sqlite3
 import tarfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import asdict
+from http.client import HTTPException, IncompleteRead
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Optional, Tuple, Union
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
@@ -25,133 +32,300 @@ if __package__ is None or __package__ == "":
 else:  # pragma: no cover
     from .manifest import DATASET_MANIFEST, DatasetConfig, DatasetFile
 
+IndexEntry = Dict[str, Union[str, int]]
+DatasetIndex = Dict[str, Dict[str, IndexEntry]]
+
 USER_AGENT = "OmniSpatialBenchmark/0.1"
 DEFAULT_DATA_DIR = Path("datasets")
-INDEX_FILE_NAME = "index.json"
+INDEX_FILE_NAME = "index.sqlite"
+LEGACY_INDEX_FILE_NAME = "index.json"
+INDEX_SCHEMA_VERSION = 3
+_MAX_DOWNLOAD_WORKERS = 8
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+_EXTRACT_BUFFER_SIZE = 4 * 1024 * 1024
+_PROGRESS_INTERVAL = 0.25
+_DOWNLOAD_RETRIES = 3
+_PRINT_LOCK = threading.Lock()
 
 
-def load_index(root: Path) -> Dict[str, Dict[str, str]]:
-    """Read the cached checksum index if available."""
-    index_path = root / INDEX_FILE_NAME
-    if not index_path.exists():
-        return {}
+def _log(message: str, end: str = "\n") -> None:
+    # Files download on worker threads; serialise output so progress lines do not interleave mid-write.
+    with _PRINT_LOCK:
+        print(message, end=end, flush=True)
+
+
+def _load_legacy_index(index_path: Path) -> DatasetIndex:
+    """Read a JSON checksum index written by earlier versions of this script."""
     try:
-        return json.loads(index_path.read_text(encoding="utf-8"))
+        payload = json.loads(index_path.read_text(encoding="utf-8"))
     except json.JSONDecodeError:
         return {}
+    if payload.get("schema_version") == 2:
+        return payload.get("datasets", {})
+    # The oldest indexes map filenames straight to checksums; without stat data they are re-hashed once.
+    return {
+        name: {filename: {"sha256": checksum} for filename, checksum in files.items()}
+        for name, files in payload.items()
+        if isinstance(files, dict)
+    }
 
 
-def save_index(root: Path, index: Dict[str, Dict[str, str]]) -> None:
-    """Persist the checksum index."""
-    (root / INDEX_FILE_NAME).write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+def open_index(root: Path) -> sqlite3.Connection:
+    """Open the checksum index, creating it (and importing a legacy JSON index) if needed.
+
+    Entries are stored one row per file so each run only writes the rows that changed,
+    every write is atomic, and concurrent runs sharing a cache wait on SQLite's lock.
+    """
+    index_path = root / INDEX_FILE_NAME
+    created = not index_path.exists()
+    connection = sqlite3.connect(index_path, timeout=60)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "dataset TEXT NOT NULL, filename TEXT NOT NULL, sha256 TEXT NOT NULL, "
+            "size INTEGER, mtime_ns INTEGER, PRIMARY KEY (dataset, filename))"
+        )
+        connection.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+    legacy_path = root / LEGACY_INDEX_FILE_NAME
+    if created and legacy_path.exists():
+        for name, files in _load_legacy_index(legacy_path).items():
+            for filename, entry in files.items():
+                record_index_entry(connection, name, filename, entry)
+    return connection
+
+
+def load_index(connection: sqlite3.Connection, dataset: str) -> Dict[str, IndexEntry]:
+    """Return the recorded entries for one dataset, keyed by filename."""
+    rows = connection.execute(
+        "SELECT filename, sha256, size, mtime_ns FROM files WHERE dataset = ?", (dataset,)
+    )
+    entries: Dict[str, IndexEntry] = {}
+    for filename, sha256, size, mtime_ns in rows:
+        entry: IndexEntry = {"sha256": sha256}
+        if size is not None and mtime_ns is not None:
+            entry.update(size=size, mtime_ns=mtime_ns)
+        entries[filename] = entry
+    return entries
+
+
+def record_index_entry(connection: sqlite3.Connection, dataset: str, filename: str, entry: IndexEntry) -> None:
+    """Insert or replace a single file's entry in its own transaction."""
+    with connection:
+        connection.execute(
+            "INSERT OR REPLACE INTO files (dataset, filename, sha256, size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+            (dataset, filename, entry["sha256"], entry.get("size"), entry.get("mtime_ns")),
+        )
 
 
 def compute_sha256(path: Path) -> str:
     """Compute the SHA256 checksum for a file."""
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            return hashlib.file_digest(handle, "sha256").hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(8 * 1024 * 1024), b""):
             digest.update(chunk)
     return digest.hexdigest()
 
 
-def download_file(url: str, destination: Path) -> None:
-    """Download a URL to the specified destination."""
+def download_file(url: str, destination: Path, *, retries: int = _DOWNLOAD_RETRIES) -> str:
+    """Download a URL to the specified destination and return its SHA256 checksum.
+
+    Transient network failures are retried with exponential backoff, resuming from the
+    bytes already written via an HTTP ``Range`` request when the server supports it.
+    """
     destination.parent.mkdir(parents=True, exist_ok=True)
-    req = Request(url, headers={"User-Agent": USER_AGENT})
-    try:
-        with urlopen(req) as response, destination.open("wb") as handle:
-            total = int(response.headers.get("Content-Length", "0")) or None
-            downloaded = 0
-            while True:
-                chunk = response.read(64 * 1024)
-                if not chunk:
-                    break
-                handle.write(chunk)
-                if total:
-                    downloaded += len(chunk)
-                    percent = (downloaded / total) * 100
-                    print(f"\r  -> {destination.name}: {downloaded / 1e6:.1f} / {total / 1e6:.1f} MB ({percent:5.1f}%)", end="")
-            if total:
-                print()
-    except HTTPError as exc:  # pragma: no cover - network failure
-        raise RuntimeError(f"Failed to download {url}: HTTP {exc.code}") from exc
-    except URLError as exc:  # pragma: no cover - network failure
-        raise RuntimeError(f"Failed to download {url}: {exc.reason}") from exc
-
-
-def extract_file(archive: Path, target_dir: Path) -> None:
-    """Extract an archive into the target directory if not already present."""
+    digest = hashlib.sha256()
+    downloaded = 0
+    attempt = 0
+    with destination.open("wb") as handle:
+        while True:
+            headers = {"User-Agent": USER_AGENT}
+            if downloaded:
+                headers["Range"] = f"bytes={downloaded}-"
+            try:
+                with urlopen(Request(url, headers=headers)) as response:
+                    if downloaded and getattr(response, "status", None) != 206:
+                        # Server ignored the range request; start over from the first byte.
+                        handle.seek(0)
+                        handle.truncate()
+                        digest = hashlib.sha256()
+                        downloaded = 0
+                    length = int(response.headers.get("Content-Length", "0")) or None
+                    total = downloaded + length if length else None
+                    last_progress = 0.0
+                    while True:
+                        chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        digest.update(chunk)
+                        handle.write(chunk)
+                        downloaded += len(chunk)
+                        # Throttle progress output so formatting and the print lock stay
+                        # off the hot path on fast links.
+                        now = time.monotonic()
+                        if total and (now - last_progress >= _PROGRESS_INTERVAL or downloaded == total):
+                            last_progress = now
+                            percent = (downloaded / total) * 100
+                            _log(f"\r  -> {destination.name}: {downloaded / 1e6:.1f} / {total / 1e6:.1f} MB ({percent:5.1f}%)", end="")
+                    if total:
+                        _log("")
+                    if total and downloaded < total:
+                        raise IncompleteRead(b"", total - downloaded)
+                return digest.hexdigest()
+            except HTTPError as exc:  # pragma: no cover - network failure
+                raise RuntimeError(f"Failed to download {url}: HTTP {exc.code}") from exc
+            except (URLError, OSError, HTTPException) as exc:  # pragma: no cover - network failure
+                if attempt >= retries:
+                    reason = exc.reason if isinstance(exc, URLError) else exc
+                    raise RuntimeError(f"Failed to download {url}: {reason}") from exc
+                delay = 2**attempt
+                attempt += 1
+                _log(f"  -> {destination.name}: transfer interrupted ({exc}); retrying in {delay}s from byte {downloaded}.")
+                time.sleep(delay)
+
+
+def _tar_mode(archive: Path) -> Optional[str]:
+    suffixes = archive.suffixes[-2:]
+    if archive.suffix == ".tar":
+        return "r:"
+    if archive.suffix in {".tgz", ".gz"}:
+        return "r:gz"
+    if archive.suffix == ".bz2":
+        return "r:bz2"
+    if suffixes == [".tar", ".xz"]:
+        return "r:xz"
+    return None
+
+
+def extract_file(archive: Path, target_dir: Path, *, resume: bool = False) -> None:
+    """Extract an archive into the target directory if not already present.
+
+    With ``resume`` set, zip members that already exist at their full size are left
+    in place so an interrupted extraction picks up where it stopped.
+    """
     target_dir.mkdir(parents=True, exist_ok=True)
     if archive.suffix == ".zip":
-        mode = "r"
-        with zipfile.ZipFile(archive, mode) as zip_handle:
-            zip_handle.extractall(target_dir)
-    elif (
-        archive.suffix in {".tar", ".tgz", ".gz", ".bz2"}
-        or len(archive.suffixes) >= 2
-        and archive.suffixes[-2:] in [
-            [".tar", ".gz"],
-            [".tar", ".bz2"],
-            [".tar", ".xz"],
-        ]
-    ):
-        with tarfile.open(archive) as tar_handle:
-            tar_handle.extractall(target_dir)
-    else:
+        with zipfile.ZipFile(archive) as zip_handle:
+            for member in zip_handle.infolist():
+                existing = target_dir / member.filename
+                if (
+                    resume
+                    and not member.is_dir()
+                    and existing.is_file()
+                    and existing.stat().st_size == member.file_size
+                ):
+                    continue
+                zip_handle.extract(member, target_dir)
+        return
+
+    mode = _tar_mode(archive)
+    if mode is None:
         raise ValueError(f"Unsupported archive format for extraction: {archive}")
+    # An explicit mode skips compression autodetection, and the large read buffer
+    # keeps the decompressor fed instead of issuing many small reads.
+    with io.BufferedReader(io.FileIO(archive, "rb"), buffer_size=_EXTRACT_BUFFER_SIZE) as raw:
+        with tarfile.open(fileobj=raw, mode=mode) as tar_handle:
+            if hasattr(tarfile, "data_filter"):
+                tar_handle.extractall(target_dir, filter="data")
+            else:  # pragma: no cover - Python builds without extraction filters
+                tar_handle.extractall(target_dir)
+
+
+def _ensure_file(
+    file: DatasetFile,
+    *,
+    dataset_dir: Path,
+    recorded: Optional[IndexEntry],
+    force: bool,
+    skip_extract: bool,
+) -> Tuple[IndexEntry, int, int]:
+    destination = dataset_dir / file.filename
+    needs_download = force or not destination.exists()
+    current = None
+    downloaded_files = 0
+    extracted_files = 0
+    recorded = recorded or {}
+
+    if not needs_download:
+        stat = destination.stat()
+        if (
+            recorded.get("sha256")
+            and recorded.get("size") == stat.st_size
+            and recorded.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            # Unchanged since it was last hashed; trust the recorded checksum.
+            current = str(recorded["sha256"])
+        else:
+            current = compute_sha256(destination)
+        if recorded.get("sha256") and recorded["sha256"] != current:
+            _log(f"Checksum mismatch for {destination}, re-downloading.")
+            needs_download = True
+        elif file.checksum and file.checksum != current:
+            _log(f"Checksum mismatch against manifest for {destination}, re-downloading.")
+            needs_download = True
+
+    if needs_download:
+        _log(f"Downloading {file.url}")
+        # The download hashes bytes as they stream in, so the file is never re-read.
+        current = download_file(file.url, destination)
+        downloaded_files += 1
+
+    checksum = current
+    if file.checksum and file.checksum != checksum:
+        raise RuntimeError(
+            f"Checksum verification failed for {file.filename}: expected {file.checksum}, observed {checksum}"
+        )
+    stat = destination.stat()
+    entry: IndexEntry = {"sha256": checksum, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    if file.extract and not skip_extract:
+        target_subdir = file.target_subdir or destination.stem
+        extraction_dir = dataset_dir / target_subdir
+        marker = extraction_dir / ".extracted"
+        if force or not marker.exists():
+            _log(f"Extracting {file.filename} -> {extraction_dir}")
+            extract_file(destination, extraction_dir, resume=not force)
+            marker.touch()
+            extracted_files += 1
+
+    return entry, downloaded_files, extracted_files
 
 
 def ensure_dataset(
     dataset: DatasetConfig,
     *,
     root: Path,
-    index: Dict[str, Dict[str, str]],
+    index: sqlite3.Connection,
     force: bool = False,
     skip_extract: bool = False,
 ) -> Tuple[int, int]:
     dataset_dir = root / dataset.name
     dataset_dir.mkdir(parents=True, exist_ok=True)
-    dataset_index = index.setdefault(dataset.name, {})
+    dataset_index = load_index(index, dataset.name)
 
     downloaded_files = 0
     extracted_files = 0
 
-    for file in dataset.files:
-        destination = dataset_dir / file.filename
-        needs_download = force or not destination.exists()
-
-        if not needs_download:
-            recorded = dataset_index.get(file.filename)
-            current = compute_sha256(destination)
-            if recorded and recorded != current:
-                print(f"Checksum mismatch for {destination}, re-downloading.")
-                needs_download = True
-            elif file.checksum and file.checksum.lower() != current:
-                print(f"Checksum mismatch against manifest for {destination}, re-downloading.")
-                needs_download = True
-
-        if needs_download:
-            print(f"Downloading {file.url}")
-            download_file(file.url, destination)
-            downloaded_files += 1
-
-        checksum = compute_sha256(destination)
-        dataset_index[file.filename] = checksum
-        if file.checksum and file.checksum.lower() != checksum:
-            raise RuntimeError(
-                f"Checksum verification failed for {file.filename}: expected {file.checksum}, observed {checksum}"
-            )
+    def _process(file: DatasetFile) -> Tuple[IndexEntry, int, int]:
+        return _ensure_file(
+            file,
+            dataset_dir=dataset_dir,
+            recorded=dataset_index.get(file.filename),
+            force=force,
+            skip_extract=skip_extract,
+        )
 
-        if file.extract and not skip_extract:
-            target_subdir = file.target_subdir or destination.stem
-            extraction_dir = dataset_dir / target_subdir
-            marker = extraction_dir / ".extracted"
-            if force or not marker.exists():
-                print(f"Extracting {file.filename} -> {extraction_dir}")
-                extract_file(destination, extraction_dir)
-                marker.touch()
-                extracted_files += 1
+    # Downloads are latency-bound, so files within a dataset are fetched concurrently;
+    # the index is only updated from this thread, in manifest order, and only for
+    # entries that changed.
+    max_workers = max(1, min(_MAX_DOWNLOAD_WORKERS, len(dataset.files)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for file, (entry, downloaded, extracted) in zip(dataset.files, executor.map(_process, dataset.files)):
+            if dataset_index.get(file.filename) != entry:
+                record_index_entry(index, dataset.name, file.filename, entry)
+            downloaded_files += downloaded
+            extracted_files += extracted
 
     return downloaded_files, extracted_files
 
@@ -248,23 +422,22 @@ def main() -> None:
         selected = [DATASET_MANIFEST[name] for name in args.datasets]
 
     args.data_dir.mkdir(parents=True, exist_ok=True)
-    index = load_index(args.data_dir)
 
     total_downloaded = 0
     total_extracted = 0
-    for dataset in selected:
-        print(f"==> {dataset.name}")
-        downloaded, extracted = ensure_dataset(
-            dataset,
-            root=args.data_dir,
-            index=index,
-            force=args.force,
-            skip_extract=args.skip_extract,
-        )
-        total_downloaded += downloaded
-        total_extracted += extracted
+    with closing(open_index(args.data_dir)) as index:
+        for dataset in selected:
+            print(f"==> {dataset.name}")
+            downloaded, extracted = ensure_dataset(
+                dataset,
+                root=args.data_dir,
+                index=index,
+                force=args.force,
+                skip_extract=args.skip_extract,
+            )
+            total_downloaded += downloaded
+            total_extracted += extracted
 
-    save_index(args.data_dir, index)
     print(f"Completed. Downloaded {total_downloaded} archive(s); extracted {total_extracted} archive(s).")
 
 
@@ -19,6 +19,11 @@ class DatasetFile:
     target_subdir: str = ""
     description: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if self.checksum is not None:
+            # Hex digests are compared against hashlib output, which is lowercase.
+            object.__setattr__(self, "checksum", self.checksum.lower())
+
 
 @dataclass(frozen=True)
 class DatasetConfig:
@@ -2,27 +2,143 @@
 
 from __future__ import annotations
 
-import re
+import json
+import os
 import sys
-from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
 
+_HEADING_PREFIX = "## ["
+_INDEX_CACHE = os.path.join(".cache", "changelog_index.json")
 
-def extract_section(changelog: Path, version: str) -> str:
-    text = changelog.read_text(encoding="utf-8")
-    pattern = re.compile(r"^## \[(?P<version>[^\]]+)\].*$", re.MULTILINE)
-    matches = list(pattern.finditer(text))
-    if not matches:
-        return text.strip()
 
-    target = next((match for match in matches if match.group("version") == version), None)
-    if target is None:
-        # Fallback to unreleased section if the version is not present.
-        target = next((match for match in matches if match.group("version").lower() == "unreleased"), matches[0])
+class _HeadingIndex(NamedTuple):
+    """Parallel lists describing every ``## [version]`` heading line."""
+
+    versions: List[str]
+    starts: List[int]
+    lines: List[str]
+
+
+def _heading_at(text: str, position: int) -> Optional[Tuple[str, int]]:
+    """Parse the ``## [`` line at ``position``; return its version and line end if valid."""
+    line_end = text.find("\n", position)
+    line_end = len(text) if line_end == -1 else line_end
+    close = text.find("]", position + len(_HEADING_PREFIX), line_end)
+    if close <= position + len(_HEADING_PREFIX):
+        return None
+    return text[position + len(_HEADING_PREFIX) : close], line_end
+
+
+def _heading_starts(text: str, position: int = 0) -> Iterator[int]:
+    """Yield the offset of every line starting with ``## [`` at or after ``position``."""
+    if position == 0 and text.startswith(_HEADING_PREFIX):
+        yield 0
+    # str.find runs CPython's vectorised substring search, far quicker than a line loop.
+    marker = "\n" + _HEADING_PREFIX
+    while True:
+        position = text.find(marker, position)
+        if position == -1:
+            return
+        position += 1
+        yield position
+
+
+def _headings(text: str) -> _HeadingIndex:
+    index = _HeadingIndex([], [], [])
+    for start in _heading_starts(text):
+        parsed = _heading_at(text, start)
+        if parsed is not None:
+            version, line_end = parsed
+            index.versions.append(version)
+            index.starts.append(start)
+            index.lines.append(text[start:line_end])
+    return index
+
+
+def _cached_headings(changelog: Union[str, os.PathLike], text: str) -> _HeadingIndex:
+    """Return the heading index for ``changelog``, reusing the on-disk copy while it is current.
+
+    The index lives in ``.cache/`` beside the changelog and is keyed on the file's path,
+    size and mtime, so repeated extractions in one release run skip the scan.
+    """
+    path = os.path.abspath(changelog)
+    stat = os.stat(path)
+    key = {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    cache_path = os.path.join(os.path.dirname(path), _INDEX_CACHE)
+    try:
+        with open(cache_path, encoding="utf-8") as handle:
+            cached = json.load(handle)
+        if cached.get("key") == key:
+            return _HeadingIndex(**cached["headings"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    headings = _headings(text)
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as handle:
+            json.dump({"key": key, "headings": headings._asdict()}, handle)
+    except OSError:  # pragma: no cover - read-only checkout; the cache is only an optimisation
+        pass
+    return headings
+
+
+def _target_index(versions: List[str], version: str) -> int:
+    if version in versions:
+        return versions.index(version)
+    # Fallback to unreleased section if the version is not present.
+    lowered = [candidate.lower() for candidate in versions]
+    return lowered.index("unreleased") if "unreleased" in lowered else 0
+
+
+def _find_line(text: str, line_prefix: str) -> int:
+    """Return the offset of the first line starting with ``line_prefix``, or -1."""
+    if text.startswith(line_prefix):
+        return 0
+    position = text.find("\n" + line_prefix)
+    return position if position == -1 else position + 1
+
+
+def _next_heading(text: str, position: int) -> int:
+    """Return the offset of the first heading line after ``position``, or ``len(text)``."""
+    for start in _heading_starts(text, position):
+        if start > position and _heading_at(text, start) is not None:
+            return start
+    return len(text)
+
+
+def _trimmed(text: str, start: int, end: int) -> str:
+    """Return ``text[start:end].strip()`` while slicing the text only once."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return text[start:end]
+
+
+def extract_section(changelog: Union[str, os.PathLike], version: str) -> str:
+    with open(changelog, encoding="utf-8") as handle:
+        text = handle.read()
+    if version.lower() == "unreleased":
+        # Pre-release previews are the common call; locate the heading with plain
+        # substring searches and skip building the index.
+        # Only an exact heading qualifies; other spellings take the general fallback.
+        start = _find_line(text, f"{_HEADING_PREFIX}{version}]")
+        if start != -1:
+            end_of_heading = text.find("\n", start)
+            end_of_heading = len(text) if end_of_heading == -1 else end_of_heading
+            heading = text[start:end_of_heading]
+            section = _trimmed(text, end_of_heading, _next_heading(text, end_of_heading))
+            return f"{heading}\n\n{section}\n"
+
+    headings = _cached_headings(changelog, text)
+    if not headings.versions:
+        return text.strip()
 
-    start = target.end()
-    following = next((match.start() for match in matches if match.start() > target.start()), len(text))
-    section = text[start:following].strip()
-    heading = target.group(0)
+    index = _target_index(headings.versions, version)
+    heading = headings.lines[index]
+    start = headings.starts[index] + len(heading)
+    following = headings.starts[index + 1] if index + 1 < len(headings.starts) else len(text)
+    section = _trimmed(text, start, following)
     return f"{heading}\n\n{section}\n"
 
 
@@ -31,8 +147,10 @@ def main() -> None:
         print("Usage: extract_changelog.py <version>", file=sys.stderr)
         sys.exit(1)
     version = sys.argv[1]
-    changelog = Path(__file__).resolve().parent.parent / "CHANGELOG.md"
-    print(extract_section(changelog, version))
+    changelog = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "CHANGELOG.md")
+    # Encode once and bypass the text layer; the trailing newline matches print().
+    sys.stdout.buffer.write(extract_section(changelog, version).encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -5,19 +5,69 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
-from pathlib import Path
+import os
+import re
+import shutil
+from typing import Optional, Sequence, Union
 
-import yaml
+# Dotted release numbers such as 0.2.0 read back as strings when left unquoted; anything
+# else (e.g. "1.0", which YAML would load as a float) is written single-quoted.
+_PLAIN_VERSION_RE = re.compile(r"[0-9]+(?:\.[0-9A-Za-z+-]+){2,}")
 
 
-def update_citation(version: str, citation_path: Path) -> None:
-    data = yaml.safe_load(citation_path.read_text())
-    data["version"] = version
-    data["date-released"] = dt.date.today().isoformat()
-    citation_path.write_text(yaml.safe_dump(data, sort_keys=False))
+def _version_scalar(version: str) -> str:
+    if _PLAIN_VERSION_RE.fullmatch(version):
+        return version
+    return "'" + version.replace("'", "''") + "'"
 
 
-def main() -> None:
+def update_citation(
+    version: str,
+    citation_path: Union[str, os.PathLike],
+    *,
+    today: Optional[dt.date] = None,
+) -> None:
+    """Set ``version`` and ``date-released`` in a CITATION.cff file.
+
+    Only the two top-level lines are rewritten, so comments and formatting elsewhere in
+    the file are preserved and no YAML library is needed. Callers updating many files
+    should import and call this directly rather than spawning the script per file.
+    """
+    replacements = {
+        "version:": f"version: {_version_scalar(version)}",
+        "date-released:": f"date-released: {(today or dt.date.today()).isoformat()}",
+    }
+    with open(citation_path) as handle:
+        lines = handle.read().splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        for key, replacement in replacements.items():
+            if line.startswith(key):
+                ending = line[len(line.rstrip("\r\n")) :]
+                lines[index] = replacement + ending
+                del replacements[key]
+                break
+        if not replacements:
+            break
+    if replacements:
+        missing = ", ".join(key.rstrip(":") for key in replacements)
+        raise SystemExit(f"CITATION file {citation_path} has no top-level {missing} field.")
+    # Write a sibling temp file and rename it over the original so an interrupted run
+    # never leaves a truncated CITATION.cff behind.
+    temp_path = os.fspath(citation_path) + ".tmp"
+    try:
+        with open(temp_path, "w") as handle:
+            handle.write("".join(lines))
+            handle.flush()
+            os.fsync(handle.fileno())
+        shutil.copymode(citation_path, temp_path)
+        os.replace(temp_path, citation_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Update version and release date in CITATION.cff")
     parser.add_argument("--version", required=True, help="Version string, e.g. 0.2.0")
     parser.add_argument(
@@ -25,12 +75,20 @@ def main() -> None:
         default="CITATION.cff",
         help="Path to the CITATION file (default: CITATION.cff)",
     )
-    args = parser.parse_args()
-    citation_path = Path(args.file).resolve()
-    if not citation_path.exists():
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = _PARSER.parse_args(argv)
+    citation_path = os.path.abspath(args.file)
+    if not os.path.exists(citation_path):
         raise SystemExit(f"CITATION file not found: {citation_path}")
-    update_citation(args.version, citation_path)
-    print(f"Updated {citation_path} to version {args.version} on {dt.date.today():%Y-%m-%d}.")
+    today = dt.date.today()
+    update_citation(args.version, citation_path, today=today)
+    print(f"Updated {citation_path} to version {args.version} on {today:%Y-%m-%d}.")
 
 
 if __name__ == "__main__":